@@ -12,16 +12,31 @@ def run_command(command: list[str], cwd: Path | None = None) -> int:
     return process.returncode
 
 
+# Host platform is resolved once at import; platform.system() calls uname() on POSIX.
+HOST_SYSTEM = platform.system()
+
+
 def is_windows() -> bool:
-    return platform.system() == "Windows"
+    return HOST_SYSTEM == "Windows"
 
 
 def is_macos() -> bool:
-    return platform.system() == "Darwin"
+    return HOST_SYSTEM == "Darwin"
 
 
 def is_linux() -> bool:
-    return platform.system() == "Linux"
+    return HOST_SYSTEM == "Linux"
+
+
+def ensure_executable(script: Path) -> None:
+    """Set the executable bit on a build script (best-effort)."""
+    if os.access(script, os.X_OK):
+        return
+    try:
+        mode = os.stat(script).st_mode
+        os.chmod(script, mode | 0o111)
+    except Exception:
+        pass
 
 
 def build_windows(repo_root: Path) -> bool:
@@ -39,12 +54,7 @@ def build_macos(repo_root: Path) -> bool:
     if not script.exists():
         print("build_macos.sh not found.")
         return False
-    # Ensure executable bit (best-effort)
-    try:
-        mode = os.stat(script).st_mode
-        os.chmod(script, mode | 0o111)
-    except Exception:
-        pass
+    ensure_executable(script)
     return run_command(["bash", str(script)], cwd=repo_root) == 0
 
 
@@ -54,12 +64,7 @@ def build_linux(repo_root: Path) -> bool:
     if not script.exists():
         print("build_linux.sh not found.")
         return False
-    # Ensure executable bit (best-effort)
-    try:
-        mode = os.stat(script).st_mode
-        os.chmod(script, mode | 0o111)
-    except Exception:
-        pass
+    ensure_executable(script)
     return run_command(["bash", str(script)], cwd=repo_root) == 0
 
 
@@ -10,14 +10,37 @@ import os
 import argparse
 import platform
 import ctypes
-import tkinter as tk
-from tkinter import messagebox
 from loguru import logger
 
 from src.push_to_talk import PushToTalkConfig
 from src.gui import show_configuration_gui
 
 
+# Detailed format shared by the debug console and file sinks
+DEBUG_LOG_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+
+# File sink options: keep the log bounded on disk and never dump local
+# variables (which may hold API keys) into exception traces.
+LOG_FILE_SINK_OPTIONS = {
+    "rotation": "10 MB",
+    "retention": 3,
+    "compression": "zip",
+    "diagnose": False,
+}
+
+ERROR_DIALOG_TEMPLATE = """An error occurred while running the application:
+
+{error}
+
+Common solutions:
+• Make sure your OpenAI API key is valid
+• Check that you have microphone permissions
+• Run as Administrator for hotkey detection
+• Ensure internet connectivity for OpenAI API
+
+Check push_to_talk.log for detailed error information."""
+
+
 def setup_logging(debug_mode: bool = False):
     """
     Configure logging based on debug mode.
@@ -33,14 +56,63 @@ def setup_logging(debug_mode: bool = False):
         logger.add(
             sys.stderr,
             level="DEBUG",
-            format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+            format=DEBUG_LOG_FORMAT,
         )
         # Also add file handler
-        logger.add("push_to_talk.log", level="DEBUG")
+        logger.add(
+            "push_to_talk.log",
+            level="DEBUG",
+            format=DEBUG_LOG_FORMAT,
+            **LOG_FILE_SINK_OPTIONS,
+        )
         logger.info("Debug mode enabled - logging to console and file")
     else:
         # Configure loguru for GUI mode - only log to file
-        logger.add("push_to_talk.log", level="INFO")
+        logger.add("push_to_talk.log", level="INFO", **LOG_FILE_SINK_OPTIONS)
+
+
+# First Windows build with shcore.SetProcessDpiAwareness (Windows 8.1)
+WINDOWS_8_1_BUILD = 9600
+
+
+def enable_high_dpi_awareness():
+    """Enable High DPI support on Windows."""
+    if platform.system() != "Windows":
+        return
+
+    try:
+        if sys.getwindowsversion().build >= WINDOWS_8_1_BUILD:
+            # 0 = DPI_AWARENESS_UNAWARE
+            # 1 = DPI_AWARENESS_SYSTEM_AWARE
+            # 2 = DPI_AWARENESS_PER_MONITOR_AWARE
+            ctypes.WinDLL("shcore", use_last_error=True).SetProcessDpiAwareness(1)
+            return
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not enable per-process DPI awareness: {e}")
+
+    try:
+        # SetProcessDPIAware (Windows Vista+), also the fallback if shcore fails
+        ctypes.WinDLL("user32", use_last_error=True).SetProcessDPIAware()
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not enable High DPI awareness: {e}")
+
+
+def show_error_dialog(error: Exception):
+    """Show a fatal error in a message box, falling back to the console."""
+    try:
+        # Imported lazily: tkinter is only needed once an error must be shown
+        import tkinter as tk
+        from tkinter import messagebox
+
+        root = tk.Tk()
+        root.withdraw()
+
+        error_message = ERROR_DIALOG_TEMPLATE.format_map({"error": error})
+        messagebox.showerror("PushToTalk - Error", error_message, parent=root)
+        root.destroy()
+    except Exception:
+        # Fallback to console if GUI fails
+        print(f"Fatal error: {error}")
 
 
 def main():
@@ -57,20 +129,7 @@ def main():
     # Setup logging based on debug flag
     setup_logging(debug_mode=args.debug)
 
-    # Enable High DPI support on Windows
-    if platform.system() == "Windows":
-        try:
-            # Try SetProcessDpiAwareness (Windows 8.1+)
-            # 0 = DPI_AWARENESS_UNAWARE
-            # 1 = DPI_AWARENESS_SYSTEM_AWARE
-            # 2 = DPI_AWARENESS_PER_MONITOR_AWARE
-            ctypes.windll.shcore.SetProcessDpiAwareness(1)
-        except Exception:
-            try:
-                # Fallback to SetProcessDPIAware (Windows Vista+)
-                ctypes.windll.user32.SetProcessDPIAware()
-            except Exception:
-                pass
+    enable_high_dpi_awareness()
 
     try:
         # Load existing config if it exists
@@ -93,30 +152,7 @@ def main():
 
     except Exception as e:
         logger.error(f"Application error: {e}")
-
-        # Show error message in GUI if possible
-        try:
-            root = tk.Tk()
-            root.withdraw()
-
-            error_message = f"""An error occurred while running the application:
-
-{str(e)}
-
-Common solutions:
-• Make sure your OpenAI API key is valid
-• Check that you have microphone permissions
-• Run as Administrator for hotkey detection
-• Ensure internet connectivity for OpenAI API
-
-Check push_to_talk.log for detailed error information."""
-
-            messagebox.showerror("PushToTalk - Error", error_message, parent=root)
-            root.destroy()
-        except Exception:
-            # Fallback to console if GUI fails
-            print(f"Fatal error: {e}")
-
+        show_error_dialog(e)
         sys.exit(1)
 
 
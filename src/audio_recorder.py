@@ -1,3 +1,4 @@
+import os
 import pyaudio
 import wave
 import threading
@@ -5,9 +6,24 @@ import tempfile
 from typing import Optional
 from loguru import logger
 
-from src.config.constants import AUDIO_RECORDING_THREAD_TIMEOUT_SECONDS
+from src.config.constants import AUDIO_DURATION_MIN_THRESHOLD_SECONDS
 from src.exceptions import AudioRecordingError
 
+# Bytes per sample for the PortAudio formats we may be configured with
+_SAMPLE_WIDTHS = {
+    pyaudio.paInt16: 2,
+    pyaudio.paInt32: 4,
+    pyaudio.paFloat32: 4,
+}
+
+# Write buffer for the recording file: chunks of a few KB arrive every
+# ~64 ms, so this batches roughly two seconds of audio per write() call
+_WAV_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Stream callback results telling PortAudio to keep capturing or to stop
+_CALLBACK_CONTINUE = (None, pyaudio.paContinue)
+_CALLBACK_ABORT = (None, pyaudio.paAbort)
+
 
 class AudioRecorder:
     def __init__(
@@ -30,17 +46,28 @@ class AudioRecorder:
         self.chunk_size = chunk_size
         self.channels = channels
         self.audio_format = audio_format
+        # The format never changes for a recorder, so resolve its width once
+        self.sample_width = self._get_sample_width()
+        self._min_frames = int(AUDIO_DURATION_MIN_THRESHOLD_SECONDS * sample_rate)
 
         self.is_recording = False
-        self.audio_data = []
-        self.recording_thread: Optional[threading.Thread] = None
+
+        # Temporary WAV file the current recording is streamed into
+        self._temp_file = None
+        self._temp_filename: Optional[str] = None
+        self._wave_writer: Optional[wave.Wave_write] = None
+        self._write_frames = None
+        # Set by the stream callback if writing a chunk to the file fails
+        self._write_error: Optional[Exception] = None
 
         self.audio_interface = None
         self.stream = None
         self._init_error: Optional[Exception] = None
 
         # Initialize PyAudio in a background thread to avoid blocking startup
-        self._init_thread = threading.Thread(target=self._initialize_audio_interface, daemon=True)
+        self._init_thread = threading.Thread(
+            target=self._initialize_audio_interface, daemon=True
+        )
         self._init_thread.start()
 
     def _initialize_audio_interface(self):
@@ -65,7 +92,9 @@ class AudioRecorder:
                 self._init_thread.join(timeout=5.0)
 
             if self._init_error:
-                logger.error(f"Cannot start recording, initialization failed: {self._init_error}")
+                logger.error(
+                    f"Cannot start recording, initialization failed: {self._init_error}"
+                )
                 return False
 
             if not self.audio_interface:
@@ -73,19 +102,22 @@ class AudioRecorder:
                 return False
 
         try:
+            # Frames are streamed straight into the WAV file while recording
+            self._write_error = None
+            self._open_wave_file()
+
+            # Capture runs on PortAudio's own callback thread, so no
+            # recording thread of our own is needed
             self.stream = self.audio_interface.open(
                 format=self.audio_format,
                 channels=self.channels,
                 rate=self.sample_rate,
                 input=True,
                 frames_per_buffer=self.chunk_size,
+                stream_callback=self._on_audio_chunk,
             )
 
             self.is_recording = True
-            self.audio_data = []
-
-            self.recording_thread = threading.Thread(target=self._record_audio)
-            self.recording_thread.start()
 
             logger.info("Audio recording started")
             return True
@@ -93,14 +125,16 @@ class AudioRecorder:
         except Exception as e:
             logger.error(f"Failed to start recording: {e}")
             self._cleanup_stream()
+            self._discard_wave_file()
             return False
 
     def stop_recording(self) -> Optional[str]:
         """
-        Stop recording and save audio to a temporary file.
+        Stop recording and finalize the temporary audio file.
 
         Returns:
-            Path to the temporary audio file, or None if recording failed
+            Path to the temporary audio file, or None if recording failed or
+            was shorter than AUDIO_DURATION_MIN_THRESHOLD_SECONDS
         """
         if not self.is_recording:
             logger.warning("No recording in progress")
@@ -108,86 +142,147 @@ class AudioRecorder:
 
         self.is_recording = False
 
-        # Wait for recording thread to finish
-        if self.recording_thread:
-            self.recording_thread.join(timeout=AUDIO_RECORDING_THREAD_TIMEOUT_SECONDS)
-
-        # Get sample width before cleanup
-        sample_width = None
-        if self.audio_interface:
-            try:
-                sample_width = self.audio_interface.get_sample_size(self.audio_format)
-            except Exception as e:
-                logger.warning(f"Could not get sample size from audio interface: {e}")
-                # Fallback: calculate sample width from format
-                if self.audio_format == pyaudio.paInt16:
-                    sample_width = 2
-                elif self.audio_format == pyaudio.paInt32:
-                    sample_width = 4
-                elif self.audio_format == pyaudio.paFloat32:
-                    sample_width = 4
-                else:
-                    sample_width = 2  # Default to 16-bit
-
-        self._cleanup_stream()
-
-        if not self.audio_data:
-            logger.warning("No audio data recorded")
+        # Stopping the stream waits for any in-flight callback to finish; the
+        # file must not be touched while callbacks may still be writing to it
+        if not self._cleanup_stream():
+            logger.error("Audio stream did not stop; dropping this recording")
             return None
 
-        if sample_width is None:
-            logger.error("Could not determine sample width")
+        if not self._wave_writer:
+            logger.error("No audio file open for recording")
             return None
 
-        # Save audio to temporary file
-        try:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-            temp_filename = temp_file.name
-            temp_file.close()
+        if self._write_error:
+            logger.error(f"Recording failed while writing audio: {self._write_error}")
+            self._discard_wave_file()
+            return None
 
-            with wave.open(temp_filename, "wb") as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(sample_width)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(b"".join(self.audio_data))
+        frames = self._wave_writer.getnframes()
+        if frames == 0:
+            logger.warning("No audio data recorded")
+            self._discard_wave_file()
+            return None
 
-            logger.info(f"Audio saved to {temp_filename}")
-            return temp_filename
+        # Clips this short are never transcribed, so don't hand them on
+        if frames < self._min_frames:
+            logger.info(
+                f"Audio too short ({frames / self.sample_rate:.3f}s); discarding recording"
+            )
+            self._discard_wave_file()
+            return None
 
+        # Closing the writer patches the RIFF header with the final sizes
+        temp_filename = self._temp_filename
+        try:
+            self._close_wave_file()
         except Exception as e:
             logger.error(f"Failed to save audio: {e}")
+            self._discard_wave_file()
             return None
 
-    def _record_audio(self):
-        """Internal method to record audio in a separate thread."""
+        logger.info(f"Audio saved to {temp_filename}")
+        return temp_filename
+
+    def _get_sample_width(self) -> int:
+        """Get the sample width in bytes for the configured audio format."""
         try:
-            while self.is_recording and self.stream:
-                data = self.stream.read(self.chunk_size, exception_on_overflow=False)
-                if isinstance(data, (bytes, bytearray)):
-                    self.audio_data.append(data)
-                else:  # pragma: no cover - defensive guard for mocked objects
-                    logger.debug(
-                        "Skipping non-bytes audio chunk during recording: %s",
-                        type(data).__name__,
-                    )
+            return pyaudio.get_sample_size(self.audio_format)
         except Exception as e:
-            logger.error(f"Error during recording: {e}")
-            self.is_recording = False
+            logger.warning(f"Could not get sample size for audio format: {e}")
+            # Fallback: look up sample width from format, default to 16-bit
+            return _SAMPLE_WIDTHS.get(self.audio_format, 2)
+
+    def _open_wave_file(self):
+        """Create the temporary WAV file that captured frames are written to."""
+        # mkstemp hands back an open descriptor, so the file is opened once
+        fd, self._temp_filename = tempfile.mkstemp(suffix=".wav")
+        self._temp_file = os.fdopen(fd, "wb", buffering=_WAV_WRITE_BUFFER_SIZE)
+
+        self._wave_writer = wave.open(self._temp_file, "wb")
+        self._wave_writer.setnchannels(self.channels)
+        self._wave_writer.setsampwidth(self.sample_width)
+        self._wave_writer.setframerate(self.sample_rate)
+        # Bound once here so the stream callback does a single lookup per chunk
+        self._write_frames = self._wave_writer.writeframesraw
+
+    def _close_wave_file(self):
+        """Finalize the WAV header and close the temporary file."""
+        wave_writer, temp_file = self._wave_writer, self._temp_file
+        self._wave_writer = None
+        self._write_frames = None
+        self._temp_file = None
+        try:
+            if wave_writer:
+                wave_writer.close()
+        finally:
+            if temp_file:
+                temp_file.close()
+
+    def _discard_wave_file(self):
+        """Close and delete the temporary WAV file of an unusable recording."""
+        temp_filename = self._temp_filename
+        self._temp_filename = None
+        try:
+            self._close_wave_file()
+        except Exception as e:
+            logger.debug(f"Error closing discarded audio file: {e}")
 
-    def _cleanup_stream(self):
-        """Clean up audio stream resources."""
+        if temp_filename:
+            try:
+                os.remove(temp_filename)
+            except OSError as e:
+                logger.debug(f"Could not remove discarded audio file: {e}")
+
+    def _on_audio_chunk(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback: append captured PCM to the WAV file."""
+        write_frames = self._write_frames
+        if write_frames is None:
+            # The file was already closed; stop capturing instead of raising
+            return _CALLBACK_ABORT
         try:
-            if self.stream:
-                self.stream.stop_stream()
-                self.stream.close()
-                self.stream = None
+            write_frames(in_data)
+        except Exception as e:
+            # Exceptions here would only reach PortAudio's stderr output, so
+            # record the failure for stop_recording() and end the stream
+            self._write_error = e
+            logger.error(f"Failed to write audio chunk: {e}")
+            return _CALLBACK_ABORT
+        return _CALLBACK_CONTINUE
+
+    def _cleanup_stream(self) -> bool:
+        """
+        Clean up audio stream resources.
 
+        Returns:
+            True if no stream is left running, False if it could not be stopped
+        """
+        if not self.stream:
+            return True
+
+        try:
+            self.stream.stop_stream()
         except Exception as e:
-            logger.error(f"Error during stream cleanup: {e}")
+            logger.error(f"Error stopping audio stream: {e}")
+
+        try:
+            # Closing also aborts a stream that failed to stop cleanly
+            self.stream.close()
+        except Exception as e:
+            logger.error(f"Error closing audio stream: {e}")
+            return False
+
+        self.stream = None
+        return True
 
     def shutdown(self):
         """Terminate audio interface."""
-        self._cleanup_stream()
+        stream_stopped = self._cleanup_stream()
+
+        # Drop any recording that was still in progress
+        if self.is_recording:
+            self.is_recording = False
+            if stream_stopped:
+                self._discard_wave_file()
 
         # Ensure init thread is done if we are shutting down
         if self._init_thread and self._init_thread.is_alive():
@@ -12,13 +12,6 @@ Rationale: Very short audio clips (<0.5s) typically don't contain
 meaningful speech and would waste API credits.
 """
 
-AUDIO_RECORDING_THREAD_TIMEOUT_SECONDS = 5.0
-"""Maximum time to wait for recording thread to stop (in seconds).
-
-Rationale: Gives recording thread ample time to clean up PyAudio
-resources while preventing indefinite blocking.
-"""
-
 # Text Insertion Timing
 TEXT_INSERTION_DELAY_AFTER_COPY_SECONDS = 0.05
 """Delay after copying text to clipboard (in seconds).
@@ -46,6 +39,20 @@ between responsiveness and avoiding redundant updates.
 CONFIG_AUTOSAVE_FILENAME = "push_to_talk_config.json"
 """Default filename for configuration persistence."""
 
+GLOSSARY_SEARCH_DEBOUNCE_DELAY_MS = 60
+"""Debounce delay for filtering the glossary list while searching (in milliseconds).
+
+Rationale: Short enough to feel instant, long enough that a burst of
+keystrokes filters the list once instead of once per character.
+"""
+
+GLOSSARY_LISTBOX_DIFF_MAX_ROWS = 300
+"""Largest glossary list that is updated row by row instead of repopulated.
+
+Rationale: Diffing the old and new rows costs up to quadratic time, so past
+this size it is cheaper to clear the listbox and insert every row again.
+"""
+
 # GUI Dimensions
 WINDOW_MIN_WIDTH = 700
 """Minimum window width (in pixels).
@@ -83,13 +90,13 @@ Most STT services process mono audio.
 """
 
 # Supported Values (for validation)
-SUPPORTED_SAMPLE_RATES = [8000, 16000, 24000, 32000, 44100, 48000]
+SUPPORTED_SAMPLE_RATES = frozenset({8000, 16000, 24000, 32000, 44100, 48000})
 """Audio sample rates supported by the application.
 
 Standard rates supported by most audio hardware and STT APIs.
 """
 
-SUPPORTED_CHUNK_SIZES = [512, 1024, 2048, 4096]
+SUPPORTED_CHUNK_SIZES = frozenset({512, 1024, 2048, 4096})
 """Audio chunk sizes supported by the application.
 
 Powers of 2 are preferred for efficient audio buffer processing.
@@ -110,3 +117,17 @@ HOTKEY_SERVICE_THREAD_TIMEOUT_SECONDS = 5.0
 Rationale: Gives hotkey listener thread ample time to clean up
 resources while preventing indefinite blocking.
 """
+
+API_KEY_CHECK_CONNECT_TIMEOUT_SECONDS = 3.0
+"""Maximum time to wait for a connection when validating an API key (in seconds).
+
+Rationale: A reachable API connects well within this, so an unreachable
+network is reported quickly instead of after the full read timeout.
+"""
+
+API_KEY_CHECK_READ_TIMEOUT_SECONDS = 7.0
+"""Maximum time to wait for the API key validation response (in seconds).
+
+Rationale: Leaves room for a slow auth endpoint once connected, keeping
+the total worst case at the previous 10 second limit.
+"""
@@ -1,6 +1,7 @@
 """API configuration section for PushToTalk configuration GUI."""
 
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk
 from typing import Callable
 from src.gui.validators import (
@@ -10,19 +11,65 @@ from src.gui.validators import (
     validate_gemini_api_key,
 )
 
+OPENAI_STT_MODELS = ("whisper-1", "gpt-4o-transcribe", "gpt-4o-mini-transcribe")
+DEEPGRAM_STT_MODELS = ("nova-3", "nova-2", "base", "enhanced", "whisper-medium")
+STT_MODELS_BY_PROVIDER = {
+    "openai": OPENAI_STT_MODELS,
+    "deepgram": DEEPGRAM_STT_MODELS,
+}
+
+OPENAI_REFINEMENT_MODELS = (
+    "gpt-5",
+    "gpt-5-mini",
+    "gpt-5-nano",
+    "gpt-4.1",
+    "gpt-4.1-mini",
+    "gpt-4.1-nano",
+    "gpt-4o-mini",
+    "gpt-4o",
+)
+CEREBRAS_REFINEMENT_MODELS = (
+    "llama-3.3-70b",
+    "qwen-3-235b-a22b-instruct-2507",
+    "qwen-3-32b",
+    "llama3.1-8b",
+    "gpt-oss-120b",
+)
+GEMINI_REFINEMENT_MODELS = (
+    "gemini-3-flash-preview",
+    "gemini-3-pro-preview",
+    "gemini-2.5-flash-preview-05-20",
+    "gemini-2.5-pro-preview-06-05",
+)
+CUSTOM_REFINEMENT_MODELS = ("llama3", "mistral", "mixtral", "gemma")
+REFINEMENT_MODELS_BY_PROVIDER = {
+    "openai": OPENAI_REFINEMENT_MODELS,
+    "cerebras": CEREBRAS_REFINEMENT_MODELS,
+    "gemini": GEMINI_REFINEMENT_MODELS,
+    "custom": CUSTOM_REFINEMENT_MODELS,
+}
+
 
 class APISection:
     """Manages the speech-to-text API configuration section."""
 
-    def __init__(self, parent: ttk.Widget, on_change: Callable[[], None] | None = None):
+    def __init__(
+        self,
+        parent: ttk.Widget,
+        on_change: Callable[[], None] | None = None,
+        on_widgets_created: Callable[[tk.Misc], None] | None = None,
+    ):
         """
         Initialize the API section.
 
         Args:
             parent: Parent widget to attach this section to
             on_change: Optional callback when configuration changes
+            on_widgets_created: Optional callback receiving widgets that are
+                created lazily after the section is built
         """
         self.on_change = on_change
+        self.on_widgets_created = on_widgets_created
 
         # API Keys section (separate from STT settings)
         self.api_keys_frame = ttk.LabelFrame(parent, text="API Keys", padding=10)
@@ -42,6 +89,7 @@ class APISection:
         self.stt_model_var = tk.StringVar()
         self.refinement_provider_var = tk.StringVar()
         self.refinement_model_var = tk.StringVar()
+        self.custom_endpoint_var = tk.StringVar()
 
         # Provider-specific widgets
         self.openai_widgets = {}
@@ -51,6 +99,7 @@ class APISection:
         self.custom_widgets = {}
         self.stt_model_combo = None
         self.refinement_model_combo = None
+        self._last_stt_provider: str | None = None
 
         # Provider-specific model selections (to preserve when switching)
         self.openai_stt_model = "gpt-4o-mini-transcribe"
@@ -85,6 +134,7 @@ class APISection:
         openai_api_key_entry.grid(
             row=0, column=1, columnspan=2, sticky="ew", padx=(10, 0), pady=2
         )
+        self._bind_commit_events(openai_api_key_entry)
 
         # OpenAI Show/Hide API Key button
         def toggle_openai_key_visibility():
@@ -122,6 +172,7 @@ class APISection:
         deepgram_api_key_entry.grid(
             row=0, column=1, columnspan=2, sticky="ew", padx=(10, 0), pady=2
         )
+        self._bind_commit_events(deepgram_api_key_entry)
 
         # Deepgram Show/Hide API Key button
         def toggle_deepgram_key_visibility():
@@ -159,6 +210,7 @@ class APISection:
         cerebras_api_key_entry.grid(
             row=0, column=1, columnspan=2, sticky="ew", padx=(10, 0), pady=2
         )
+        self._bind_commit_events(cerebras_api_key_entry)
 
         # Cerebras Show/Hide API Key button
         def toggle_cerebras_key_visibility():
@@ -196,6 +248,7 @@ class APISection:
         gemini_api_key_entry.grid(
             row=0, column=1, columnspan=2, sticky="ew", padx=(10, 0), pady=2
         )
+        self._bind_commit_events(gemini_api_key_entry)
 
         # Gemini Show/Hide API Key button
         def toggle_gemini_key_visibility():
@@ -233,6 +286,7 @@ class APISection:
         custom_api_key_entry.grid(
             row=0, column=1, columnspan=2, sticky="ew", padx=(10, 0), pady=2
         )
+        self._bind_commit_events(custom_api_key_entry)
 
         # Custom Show/Hide API Key button
         def toggle_custom_key_visibility():
@@ -274,7 +328,7 @@ class APISection:
         self.stt_model_combo = ttk.Combobox(
             self.frame,
             textvariable=self.stt_model_var,
-            values=["whisper-1", "gpt-4o-transcribe", "gpt-4o-mini-transcribe"],
+            values=OPENAI_STT_MODELS,
             state="readonly",
             width=20,
         )
@@ -306,16 +360,7 @@ class APISection:
         self.refinement_model_combo = ttk.Combobox(
             self.frame,
             textvariable=self.refinement_model_var,
-            values=[
-                "gpt-5",
-                "gpt-5-mini",
-                "gpt-5-nano",
-                "gpt-4.1",
-                "gpt-4.1-mini",
-                "gpt-4.1-nano",
-                "gpt-4o-mini",
-                "gpt-4o",
-            ],
+            values=OPENAI_REFINEMENT_MODELS,
             state="normal",  # Allow custom model names
             width=30,
         )
@@ -326,40 +371,33 @@ class APISection:
             "<<ComboboxSelected>>", self._on_refinement_model_changed
         )
 
-        # Custom API Endpoint (optional)
-        self.custom_endpoint_frame = ttk.Frame(self.frame)
-        self.custom_endpoint_frame.grid(
-            row=4, column=0, columnspan=2, sticky="ew", pady=2
-        )
-        self.custom_endpoint_frame.columnconfigure(1, weight=1)
-
-        ttk.Label(self.custom_endpoint_frame, text="Custom Endpoint:").grid(
-            row=0, column=0, sticky="w", pady=2
-        )
-        self.custom_endpoint_var = tk.StringVar()
-        self.custom_endpoint_entry = ttk.Entry(
-            self.custom_endpoint_frame,
-            textvariable=self.custom_endpoint_var,
-            width=32,
-        )
-        self.custom_endpoint_entry.grid(
-            row=0, column=1, sticky="w", padx=(10, 0), pady=2
-        )
-        # Add tooltip-style label
-        ttk.Label(
-            self.custom_endpoint_frame,
-            text="(Optional: for OpenAI-compatible APIs)",
-            font=("TkDefaultFont", 8),
-            foreground="gray",
-        ).grid(row=1, column=1, sticky="w", padx=(10, 0), pady=0)
+        # Custom API Endpoint (optional, built when the custom provider is first shown)
+        self.custom_endpoint_frame = None
+        self.custom_endpoint_entry = None
 
         self.frame.columnconfigure(1, weight=1)
 
         # Initial visibility update
         self._update_custom_endpoint_visibility()
 
+    def _bind_commit_events(self, entry: ttk.Entry):
+        """Apply free-text edits when the entry loses focus or Return is pressed."""
+        entry.bind("<FocusOut>", self._on_text_committed, add="+")
+        entry.bind("<Return>", self._on_text_committed, add="+")
+
+    def _on_text_committed(self, event=None):
+        """Handle a finished edit in one of the free-text entries."""
+        if self.on_change:
+            self.on_change()
+
     def _on_provider_changed(self, event=None):
         """Handle STT provider changes - show/hide appropriate API key fields."""
+        provider_value = self.stt_provider_var.get()
+        # Re-selecting the current provider still fires <<ComboboxSelected>>
+        if provider_value == self._last_stt_provider:
+            return
+        self._last_stt_provider = provider_value
+
         self._update_stt_model_options()
         if self.on_change:
             self.on_change()
@@ -382,12 +420,47 @@ class APISection:
         if self.on_change:
             self.on_change()
 
+    def _ensure_custom_endpoint_widgets(self):
+        """Create the custom endpoint row the first time it needs to be shown."""
+        if self.custom_endpoint_frame is not None:
+            return
+
+        self.custom_endpoint_frame = ttk.Frame(self.frame)
+        self.custom_endpoint_frame.grid(
+            row=4, column=0, columnspan=2, sticky="ew", pady=2
+        )
+        self.custom_endpoint_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(self.custom_endpoint_frame, text="Custom Endpoint:").grid(
+            row=0, column=0, sticky="w", pady=2
+        )
+        self.custom_endpoint_entry = ttk.Entry(
+            self.custom_endpoint_frame,
+            textvariable=self.custom_endpoint_var,
+            width=32,
+        )
+        self.custom_endpoint_entry.grid(
+            row=0, column=1, sticky="w", padx=(10, 0), pady=2
+        )
+        self._bind_commit_events(self.custom_endpoint_entry)
+        # Add tooltip-style label
+        ttk.Label(
+            self.custom_endpoint_frame,
+            text="(Optional: for OpenAI-compatible APIs)",
+            font=("TkDefaultFont", 8),
+            foreground="gray",
+        ).grid(row=1, column=1, sticky="w", padx=(10, 0), pady=0)
+
+        if self.on_widgets_created:
+            self.on_widgets_created(self.custom_endpoint_frame)
+
     def _update_custom_endpoint_visibility(self):
         """Show or hide the custom endpoint field based on refinement provider."""
         provider = self.refinement_provider_var.get()
         if provider == "custom":
+            self._ensure_custom_endpoint_widgets()
             self.custom_endpoint_frame.grid()
-        else:
+        elif self.custom_endpoint_frame is not None:
             self.custom_endpoint_frame.grid_remove()
 
     def _on_refinement_model_changed(self, event=None):
@@ -413,34 +486,30 @@ class APISection:
         provider_value = self.stt_provider_var.get()
         current_model = self.stt_model_var.get()
 
-        # Define model lists
-        openai_models = ["whisper-1", "gpt-4o-transcribe", "gpt-4o-mini-transcribe"]
-        deepgram_models = ["nova-3", "nova-2", "base", "enhanced", "whisper-medium"]
-
         # Save the current model to the appropriate provider-specific variable
         # This preserves the selection before we change providers
-        if current_model in openai_models:
+        if current_model in OPENAI_STT_MODELS:
             self.openai_stt_model = current_model
-        elif current_model in deepgram_models:
+        elif current_model in DEEPGRAM_STT_MODELS:
             self.deepgram_stt_model = current_model
 
         # Update model options and restore provider-specific selection
         if provider_value == "openai":
-            models = openai_models
+            models = OPENAI_STT_MODELS
             # Restore the previously selected OpenAI model
             if self.openai_stt_model in models:
                 self.stt_model_var.set(self.openai_stt_model)
             else:
                 self.stt_model_var.set(models[0])
         elif provider_value == "deepgram":
-            models = deepgram_models
+            models = DEEPGRAM_STT_MODELS
             # Restore the previously selected Deepgram model
             if self.deepgram_stt_model in models:
                 self.stt_model_var.set(self.deepgram_stt_model)
             else:
                 self.stt_model_var.set(models[0])
         else:
-            models = []
+            models = ()
 
         self.stt_model_combo["values"] = models
 
@@ -452,78 +521,47 @@ class APISection:
         provider_value = self.refinement_provider_var.get()
         current_model = self.refinement_model_var.get()
 
-        # Define model lists
-        openai_models = [
-            "gpt-5",
-            "gpt-5-mini",
-            "gpt-5-nano",
-            "gpt-4.1",
-            "gpt-4.1-mini",
-            "gpt-4.1-nano",
-            "gpt-4o-mini",
-            "gpt-4o",
-        ]
-        cerebras_models = [
-            "llama-3.3-70b",
-            "qwen-3-235b-a22b-instruct-2507",
-            "qwen-3-32b",
-            "llama3.1-8b",
-            "gpt-oss-120b",
-        ]
-        gemini_models = [
-            "gemini-3-flash-preview",
-            "gemini-3-pro-preview",
-            "gemini-2.5-flash-preview-05-20",
-            "gemini-2.5-pro-preview-06-05",
-        ]
-        custom_models = [
-            "llama3",
-            "mistral",
-            "mixtral",
-            "gemma",
-        ]
-
         # Save the current model to the appropriate provider-specific variable
-        if current_model in openai_models:
+        if current_model in OPENAI_REFINEMENT_MODELS:
             self.openai_refinement_model = current_model
-        elif current_model in cerebras_models:
+        elif current_model in CEREBRAS_REFINEMENT_MODELS:
             self.cerebras_refinement_model = current_model
-        elif current_model in gemini_models:
+        elif current_model in GEMINI_REFINEMENT_MODELS:
             self.gemini_refinement_model = current_model
-        elif current_model in custom_models:
+        elif current_model in CUSTOM_REFINEMENT_MODELS:
             self.custom_refinement_model = current_model
 
         # Update model options and restore provider-specific selection
         if provider_value == "openai":
-            models = openai_models
+            models = OPENAI_REFINEMENT_MODELS
             # Restore the previously selected OpenAI model
             if self.openai_refinement_model in models:
                 self.refinement_model_var.set(self.openai_refinement_model)
             else:
                 self.refinement_model_var.set(models[0])
         elif provider_value == "cerebras":
-            models = cerebras_models
+            models = CEREBRAS_REFINEMENT_MODELS
             # Restore the previously selected Cerebras model
             if self.cerebras_refinement_model in models:
                 self.refinement_model_var.set(self.cerebras_refinement_model)
             else:
                 self.refinement_model_var.set(models[0])
         elif provider_value == "gemini":
-            models = gemini_models
+            models = GEMINI_REFINEMENT_MODELS
             # Restore the previously selected Gemini model
             if self.gemini_refinement_model in models:
                 self.refinement_model_var.set(self.gemini_refinement_model)
             else:
                 self.refinement_model_var.set(models[0])
         elif provider_value == "custom":
-            models = custom_models
+            models = CUSTOM_REFINEMENT_MODELS
             # Restore the previously selected Custom model
             if self.custom_refinement_model in models:
                 self.refinement_model_var.set(self.custom_refinement_model)
             else:
                 self.refinement_model_var.set(models[0])
         else:
-            models = []
+            models = ()
 
         self.refinement_model_combo["values"] = models
 
@@ -605,6 +643,7 @@ class APISection:
 
         # Set providers (this triggers combobox value list updates)
         self.stt_provider_var.set(stt_provider)
+        self._last_stt_provider = stt_provider
         self.refinement_provider_var.set(refinement_provider)
 
         # Update visibility of custom endpoint
@@ -620,78 +659,75 @@ class APISection:
 
     def _update_combobox_options_only(self):
         """Update combobox dropdown options without changing selected values."""
-        # Update STT model options
         if self.stt_model_combo:
-            provider = self.stt_provider_var.get()
-            if provider == "openai":
-                models = ["whisper-1", "gpt-4o-transcribe", "gpt-4o-mini-transcribe"]
-            elif provider == "deepgram":
-                models = ["nova-3", "nova-2", "base", "enhanced", "whisper-medium"]
-            else:
-                models = []
-            self.stt_model_combo["values"] = models
+            self.stt_model_combo["values"] = STT_MODELS_BY_PROVIDER.get(
+                self.stt_provider_var.get(), ()
+            )
 
-        # Update refinement model options
         if self.refinement_model_combo:
-            provider = self.refinement_provider_var.get()
-            if provider == "openai":
-                models = [
-                    "gpt-5",
-                    "gpt-5-mini",
-                    "gpt-5-nano",
-                    "gpt-4.1",
-                    "gpt-4.1-mini",
-                    "gpt-4.1-nano",
-                    "gpt-4o-mini",
-                    "gpt-4o",
-                ]
-            elif provider == "cerebras":
-                models = [
-                    "llama-3.3-70b",
-                    "qwen-3-235b-a22b-instruct-2507",
-                    "qwen-3-32b",
-                    "llama3.1-8b",
-                ]
-            elif provider == "gemini":
-                models = [
-                    "gemini-3-flash-preview",
-                    "gemini-3-pro-preview",
-                    "gemini-2.5-flash-preview-05-20",
-                    "gemini-2.5-pro-preview-06-05",
-                ]
-            elif provider == "custom":
-                models = [
-                    "llama3",
-                    "mistral",
-                    "mixtral",
-                    "gemma",
-                ]
-            else:
-                models = []
-            self.refinement_model_combo["values"] = models
+            self.refinement_model_combo["values"] = REFINEMENT_MODELS_BY_PROVIDER.get(
+                self.refinement_provider_var.get(), ()
+            )
+
+    def _check_api_keys(self, values: dict[str, str]) -> dict[str, tuple[str, str]]:
+        """
+        Validate every configured provider key concurrently.
+
+        Args:
+            values: Snapshot of the section values from get_values()
 
-    def test_api_keys(self) -> str:
+        Returns:
+            Mapping of provider name to (prefix, status) for the report
+        """
+        validators = {
+            "openai": validate_openai_api_key,
+            "deepgram": validate_deepgram_api_key,
+            "cerebras": validate_cerebras_api_key,
+            "gemini": validate_gemini_api_key,
+        }
+        results = {provider: ("[ ]", "Not configured") for provider in validators}
+
+        pending = {}
+        for provider in validators:
+            api_key = values[f"{provider}_api_key"]
+            if api_key:
+                pending[provider] = api_key
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {
+                    provider: executor.submit(validators[provider], api_key)
+                    for provider, api_key in pending.items()
+                }
+            for provider, future in futures.items():
+                try:
+                    future.result()
+                    results[provider] = ("[OK]", "VALID")
+                except Exception as e:
+                    results[provider] = ("[X]", str(e))
+
+        return results
+
+    def test_api_keys(self, values: dict[str, str] | None = None) -> str:
         """
         Test all provider API keys and return a comprehensive status report.
 
+        The provider checks make network requests, so callers on the Tk thread
+        should take a get_values() snapshot and run this in a worker thread.
+
+        Args:
+            values: Snapshot from get_values(); read from the widgets if omitted
+
         Returns:
             Multi-line string with test results
         """
-        values = self.get_values()
+        if values is None:
+            values = self.get_values()
+        key_status = self._check_api_keys(values)
         status_lines = ["API Key Validation Status:\n"]
 
-        # Test OpenAI
-        openai_status = "Not configured"
-        openai_prefix = "[ ]"
-        if values["openai_api_key"]:
-            try:
-                validate_openai_api_key(values["openai_api_key"])
-                openai_status = "VALID"
-                openai_prefix = "[OK]"
-            except Exception as e:
-                openai_status = str(e)
-                openai_prefix = "[X]"
-
+        # OpenAI
+        openai_prefix, openai_status = key_status["openai"]
         selected_marker = (
             " (Selected STT Model)" if values["stt_provider"] == "openai" else ""
         )
@@ -702,18 +738,8 @@ class APISection:
                 f"  Key: {'*' * min(len(values['openai_api_key']), 20)}"
             )
 
-        # Test Deepgram
-        deepgram_status = "Not configured"
-        deepgram_prefix = "[ ]"
-        if values["deepgram_api_key"]:
-            try:
-                validate_deepgram_api_key(values["deepgram_api_key"])
-                deepgram_status = "VALID"
-                deepgram_prefix = "[OK]"
-            except Exception as e:
-                deepgram_status = str(e)
-                deepgram_prefix = "[X]"
-
+        # Deepgram
+        deepgram_prefix, deepgram_status = key_status["deepgram"]
         selected_marker = (
             " (Selected STT Model)" if values["stt_provider"] == "deepgram" else ""
         )
@@ -724,18 +750,8 @@ class APISection:
                 f"  Key: {'*' * min(len(values['deepgram_api_key']), 20)}"
             )
 
-        # Test Cerebras
-        cerebras_status = "Not configured"
-        cerebras_prefix = "[ ]"
-        if values["cerebras_api_key"]:
-            try:
-                validate_cerebras_api_key(values["cerebras_api_key"])
-                cerebras_status = "VALID"
-                cerebras_prefix = "[OK]"
-            except Exception as e:
-                cerebras_status = str(e)
-                cerebras_prefix = "[X]"
-
+        # Cerebras
+        cerebras_prefix, cerebras_status = key_status["cerebras"]
         selected_marker = (
             " (Selected Refinement Model)"
             if values["refinement_provider"] == "cerebras"
@@ -748,18 +764,8 @@ class APISection:
                 f"  Key: {'*' * min(len(values['cerebras_api_key']), 20)}"
             )
 
-        # Test Gemini
-        gemini_status = "Not configured"
-        gemini_prefix = "[ ]"
-        if values["gemini_api_key"]:
-            try:
-                validate_gemini_api_key(values["gemini_api_key"])
-                gemini_status = "VALID"
-                gemini_prefix = "[OK]"
-            except Exception as e:
-                gemini_status = str(e)
-                gemini_prefix = "[X]"
-
+        # Gemini
+        gemini_prefix, gemini_status = key_status["gemini"]
         selected_marker = (
             " (Selected Refinement Model)"
             if values["refinement_provider"] == "gemini"
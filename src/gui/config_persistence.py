@@ -1,20 +1,78 @@
 """Configuration file persistence for PushToTalk."""
 
 import json
+import os
+import tempfile
 import threading
 from typing import Optional, Tuple
 from loguru import logger
 from src.push_to_talk import PushToTalkConfig
 
 
+def _encode_config(config_data: dict) -> str:
+    """Encode configuration data as indented JSON, since users edit the file by hand."""
+    return json.dumps(config_data, indent=2)
+
+
+def _write_config_file(content: str, filepath: str):
+    """
+    Write encoded configuration to disk in a single write.
+
+    The content goes to a temporary file that then replaces the target, so an
+    interrupted save never leaves a truncated config behind. Each write gets
+    its own uniquely named temporary file, so an async save and a sync save
+    running at the same time can't mix their output.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, filepath)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class ConfigurationPersistence:
     """Handles saving and loading configuration files with async support."""
 
     def __init__(self):
         """Initialize the persistence manager."""
         self._save_lock = threading.Lock()
-        self._save_in_progress = False
+        self._save_ready = threading.Condition(self._save_lock)
+        self._save_thread: Optional[threading.Thread] = None
         self._queued_save: Optional[Tuple[PushToTalkConfig, str]] = None
+        self._config_mirror: Optional[dict] = None
+        # Path and JSON text of the most recent successful write
+        self._last_saved: Optional[Tuple[str, str]] = None
+
+    def _serialize_config(self, config: PushToTalkConfig) -> dict:
+        """
+        Return the JSON payload for a configuration, patching only changed fields.
+
+        The dictionary from the previous auto-save is kept and updated in place,
+        so a single edited field doesn't require dumping the whole model again.
+        Only the single save worker thread calls this.
+
+        Args:
+            config: Configuration object to serialize
+
+        Returns:
+            Dictionary mirroring the configuration fields
+        """
+        mirror = self._config_mirror
+        if mirror is None:
+            self._config_mirror = config.model_dump()
+            return self._config_mirror
+
+        for name in type(config).model_fields:
+            value = getattr(config, name)
+            if mirror[name] != value:
+                mirror[name] = list(value) if isinstance(value, list) else value
+        return mirror
 
     def save_async(
         self, config: PushToTalkConfig, filepath: str = "push_to_talk_config.json"
@@ -26,58 +84,52 @@ class ConfigurationPersistence:
         ensuring configuration changes are persisted without affecting GUI responsiveness.
 
         Features:
-        - Thread-safe with lock to prevent concurrent save operations
-        - Non-blocking background save using daemon thread
-        - Deduplication: queues latest config when save is in progress (doesn't discard)
+        - Single long-lived daemon worker, started on the first save and reused
+        - Deduplication: only the latest requested config is kept while a save runs
         - Error handling with logging but no GUI interruption
 
         Args:
             config: Configuration object to save
             filepath: Path to save the configuration JSON file
         """
+        with self._save_ready:
+            # Overwrite any save that hasn't started yet; the latest config wins
+            self._queued_save = (config, filepath)
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(
+                    target=self._save_worker_loop,
+                    daemon=True,
+                    name="ConfigSaveWorker",
+                )
+                self._save_thread.start()
+            self._save_ready.notify()
+
+    def _save_worker_loop(self):
+        """Background worker that writes queued configurations one at a time."""
+        while True:
+            with self._save_ready:
+                while self._queued_save is None:
+                    self._save_ready.wait()
+                cfg, path = self._queued_save
+                self._queued_save = None
+
+            try:
+                content = _encode_config(self._serialize_config(cfg))
+                with self._save_lock:
+                    unchanged = self._last_saved == (path, content)
+                if unchanged:
+                    # e.g. a checkbox toggled and toggled back within the debounce
+                    logger.debug(f"Configuration unchanged, skipped saving {path}")
+                    continue
 
-        def _save_worker(cfg: PushToTalkConfig, path: str):
-            """Background worker for saving configuration."""
-            while True:
-                try:
-                    # Perform the actual save
-                    config_data = cfg.model_dump()
-                    with open(path, "w") as f:
-                        json.dump(config_data, f, indent=2)
-
-                    logger.debug(f"Configuration auto-saved to {path}")
-
-                except Exception as error:
-                    logger.error(
-                        f"Failed to auto-save configuration to {path}: {error}"
-                    )
-
-                # Check if there's a queued save to process
+                _write_config_file(content, path)
                 with self._save_lock:
-                    if self._queued_save is not None:
-                        # Process the queued save
-                        cfg, path = self._queued_save
-                        self._queued_save = None
-                        # Continue the loop to save the queued config
-                    else:
-                        # No more saves queued, mark as complete and exit
-                        self._save_in_progress = False
-                        break
-
-        # Thread-safe check and either start save or queue
-        with self._save_lock:
-            if self._save_in_progress:
-                # Save already in progress, queue this config (overwrites any previous queue)
-                self._queued_save = (config, filepath)
-                return
+                    self._last_saved = (path, content)
 
-            self._save_in_progress = True
+                logger.debug(f"Configuration auto-saved to {path}")
 
-        # Start background save
-        save_thread = threading.Thread(
-            target=_save_worker, args=(config, filepath), daemon=True
-        )
-        save_thread.start()
+            except Exception as error:
+                logger.error(f"Failed to auto-save configuration to {path}: {error}")
 
     def save_sync(
         self, config: PushToTalkConfig, filepath: str = "push_to_talk_config.json"
@@ -92,7 +144,8 @@ class ConfigurationPersistence:
         Raises:
             Exception: If save operation fails
         """
-        config_data = config.model_dump()
-        with open(filepath, "w") as f:
-            json.dump(config_data, f, indent=2)
+        content = _encode_config(config.model_dump())
+        _write_config_file(content, filepath)
+        with self._save_lock:
+            self._last_saved = (filepath, content)
         logger.info(f"Configuration saved to {filepath}")
@@ -18,6 +18,22 @@ from src.gui.status_section import StatusSection
 from src.gui.validators import validate_configuration
 from src.gui.config_persistence import ConfigurationPersistence
 
+WELCOME_TEXT = """AI Speech-to-Text with Push-to-Talk
+
+This application provides push-to-talk speech-to-text functionality with AI refinement.
+
+Configure your settings below, then click "Start Application" to begin:"""
+
+WELCOME_REQUIREMENTS = (
+    "• Valid API Key for Speech Recognition",
+    "• Microphone access",
+    "• Appropriate system permissions (for global hotkeys)",
+)
+
+# Bind tag carrying the page scroll handler for widgets inside the scrollable area
+SCROLL_BINDTAG = "ConfigScroll"
+SELF_SCROLLING_WIDGET_CLASSES = frozenset({"Text", "Listbox", "TCombobox"})
+
 
 class ConfigurationWindow:
     """Main GUI window for configuring PushToTalk application settings."""
@@ -46,6 +62,7 @@ class ConfigurationWindow:
         self.app_instance = None
         self.app_thread = None
         self.is_running = False
+        self._test_in_progress = False
 
         # UI sections
         self.api_section = None
@@ -57,11 +74,14 @@ class ConfigurationWindow:
 
         # Main action button
         self.main_action_btn = None
+        self.test_btn = None
 
         # Configuration change tracking
         self._variable_traces: list[tuple[tk.Variable, str]] = []
         self._suspend_change_events = False
         self._pending_update_job: str | None = None
+        self._last_gui_fingerprint: tuple | None = None
+        self._config_variables: tuple[tk.Variable, ...] | None = None
         self._initialization_complete = False  # Track if initial setup is done
 
         # Configuration persistence
@@ -105,12 +125,14 @@ class ConfigurationWindow:
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self.root.bind_class(SCROLL_BINDTAG, "<MouseWheel>", _on_mousewheel)
 
         # Create sections
         self._create_welcome_section(scrollable_frame)
         self.api_section = APISection(
-            scrollable_frame, on_change=self._on_config_changed
+            scrollable_frame,
+            on_change=self._on_config_changed,
+            on_widgets_created=self._add_scroll_bindtag,
         )
         self.hotkey_section = HotkeySection(scrollable_frame)
         self.glossary_section = GlossarySection(
@@ -128,6 +150,7 @@ class ConfigurationWindow:
         self.feature_flags_section = FeatureFlagsSection(scrollable_frame)
         self.status_section = StatusSection(scrollable_frame)
         self._create_buttons_section(scrollable_frame)
+        self._add_scroll_bindtag(main_frame)
 
         # Set initial values
         self._update_sections_from_config(self.config)
@@ -146,20 +169,33 @@ class ConfigurationWindow:
 
         return self.root
 
+    def _add_scroll_bindtag(self, widget: tk.Misc):
+        """
+        Route mouse wheel events from a widget and its descendants to the canvas.
+
+        Widgets that scroll their own content keep their default bindings so the
+        wheel doesn't move the page and the widget at the same time. Widgets
+        that already carry the tag are left as they are, so sections can pass
+        in lazily created widgets.
+        """
+        tags = widget.bindtags()
+        if (
+            widget.winfo_class() not in SELF_SCROLLING_WIDGET_CLASSES
+            and SCROLL_BINDTAG not in tags
+        ):
+            # Insert before the trailing "all" tag
+            widget.bindtags(tags[:-1] + (SCROLL_BINDTAG,) + tags[-1:])
+        for child in widget.winfo_children():
+            self._add_scroll_bindtag(child)
+
     def _create_welcome_section(self, parent: ttk.Widget):
         """Create welcome message section at the top."""
         frame = ttk.LabelFrame(parent, text="Welcome to PushToTalk", padding=15)
         frame.pack(fill="x", pady=(0, 15))
 
         # Main welcome text
-        welcome_text = """AI Speech-to-Text with Push-to-Talk
-
-This application provides push-to-talk speech-to-text functionality with AI refinement.
-
-Configure your settings below, then click "Start Application" to begin:"""
-
         welcome_label = ttk.Label(
-            frame, text=welcome_text, font=("TkDefaultFont", 10), justify="left"
+            frame, text=WELCOME_TEXT, font=("TkDefaultFont", 10), justify="left"
         )
         welcome_label.pack(anchor="w")
 
@@ -168,16 +204,13 @@ Configure your settings below, then click "Start Application" to begin:"""
             anchor="w", pady=(10, 2)
         )
 
-        requirements = [
-            "• Valid API Key for Speech Recognition",
-            "• Microphone access",
-            "• Appropriate system permissions (for global hotkeys)",
-        ]
-
-        for req in requirements:
-            ttk.Label(
-                frame, text=req, font=("TkDefaultFont", 8), foreground="gray"
-            ).pack(anchor="w")
+        ttk.Label(
+            frame,
+            text="\n".join(WELCOME_REQUIREMENTS),
+            font=("TkDefaultFont", 8),
+            foreground="gray",
+            justify="left",
+        ).pack(anchor="w")
 
     def _create_buttons_section(self, parent: ttk.Widget):
         """Create buttons section."""
@@ -197,10 +230,10 @@ Configure your settings below, then click "Start Application" to begin:"""
         self.main_action_btn.pack(side="left", padx=(0, 10))
 
         # Test Configuration button
-        test_btn = ttk.Button(
+        self.test_btn = ttk.Button(
             button_frame, text="Test Configuration", command=self._test_configuration
         )
-        test_btn.pack(side="left", padx=(0, 10))
+        self.test_btn.pack(side="left", padx=(0, 10))
 
         # Reset to Defaults button
         reset_btn = ttk.Button(
@@ -226,65 +259,92 @@ Configure your settings below, then click "Start Application" to begin:"""
 
         self._suspend_change_events = True
         try:
-            # Get all Tkinter variables from all sections
-            all_vars = []
-            if self.api_section:
-                all_vars.extend(
-                    [
-                        self.api_section.stt_provider_var,
-                        self.api_section.openai_api_key_var,
-                        self.api_section.deepgram_api_key_var,
-                        self.api_section.cerebras_api_key_var,
-                        self.api_section.gemini_api_key_var,
-                        self.api_section.custom_api_key_var,
-                        self.api_section.stt_model_var,
-                        self.api_section.refinement_provider_var,
-                        self.api_section.refinement_model_var,
-                        self.api_section.custom_endpoint_var,
-                    ]
-                )
-            if self.hotkey_section:
-                all_vars.extend(
-                    [
-                        self.hotkey_section.hotkey_var,
-                        self.hotkey_section.toggle_hotkey_var,
-                    ]
-                )
-            if self.feature_flags_section:
-                all_vars.extend(
-                    [
-                        self.feature_flags_section.enable_text_refinement_var,
-                        self.feature_flags_section.enable_logging_var,
-                        self.feature_flags_section.enable_audio_feedback_var,
-                        self.feature_flags_section.debug_mode_var,
-                    ]
-                )
-
             # Attach traces
-            for var in all_vars:
+            for var in self._get_traced_variables():
                 trace_id = var.trace_add("write", self._on_config_changed)
                 self._variable_traces.append((var, trace_id))
         finally:
             self._suspend_change_events = False
 
+    def _get_traced_variables(self) -> list[tk.Variable]:
+        """
+        Return the variables whose changes are applied as soon as they're written.
+
+        Free-text entries (API keys, custom endpoint) are left out; the API
+        section reports those on focus-out or Return instead of per keystroke.
+        Hotkeys stay traced because the hotkey recorder sets them directly.
+        """
+        traced_vars = []
+        if self.api_section:
+            traced_vars.extend(
+                [
+                    self.api_section.stt_provider_var,
+                    self.api_section.stt_model_var,
+                    self.api_section.refinement_provider_var,
+                    self.api_section.refinement_model_var,
+                ]
+            )
+        if self.hotkey_section:
+            traced_vars.extend(
+                [
+                    self.hotkey_section.hotkey_var,
+                    self.hotkey_section.toggle_hotkey_var,
+                ]
+            )
+        if self.feature_flags_section:
+            traced_vars.extend(
+                [
+                    self.feature_flags_section.enable_text_refinement_var,
+                    self.feature_flags_section.enable_logging_var,
+                    self.feature_flags_section.enable_audio_feedback_var,
+                    self.feature_flags_section.debug_mode_var,
+                ]
+            )
+        return traced_vars
+
+    def _get_config_variables(self) -> list[tk.Variable]:
+        """Return all Tkinter variables backing configuration fields."""
+        config_vars = self._get_traced_variables()
+        if self.api_section:
+            config_vars.extend(
+                [
+                    self.api_section.openai_api_key_var,
+                    self.api_section.deepgram_api_key_var,
+                    self.api_section.cerebras_api_key_var,
+                    self.api_section.gemini_api_key_var,
+                    self.api_section.custom_api_key_var,
+                    self.api_section.custom_endpoint_var,
+                ]
+            )
+        return config_vars
+
+    def _get_gui_fingerprint(self) -> tuple:
+        """Return a cheap snapshot of the raw GUI values for change detection."""
+        if self._config_variables is None:
+            # Sections are built once, so the variable set never changes afterwards
+            self._config_variables = tuple(self._get_config_variables())
+        return (
+            tuple(var.get() for var in self._config_variables),
+            self.glossary_section.terms_version,
+            self.prompt_section.get_prompt(),
+        )
+
     def _on_config_changed(self, *args):
         """
         Handle configuration variable changes from the GUI.
 
-        Implements debouncing to prevent excessive updates during rapid user input.
+        Coalesces rapid user input into one update per debounce window: the first
+        change schedules the update, and later changes within the window are
+        picked up when it runs instead of rescheduling the timer.
         """
         if self._suspend_change_events:
             return
 
         if self.root and self.root.winfo_exists():
-            if self._pending_update_job:
-                try:
-                    self.root.after_cancel(self._pending_update_job)
-                except Exception:
-                    pass
-            self._pending_update_job = self.root.after(
-                CONFIG_CHANGE_DEBOUNCE_DELAY_MS, self._apply_config_changes
-            )
+            if self._pending_update_job is None:
+                self._pending_update_job = self.root.after(
+                    CONFIG_CHANGE_DEBOUNCE_DELAY_MS, self._apply_config_changes
+                )
         else:
             self._apply_config_changes()
 
@@ -300,6 +360,11 @@ Configure your settings below, then click "Start Application" to begin:"""
         Args:
             force: If True, skip the config comparison and force an update
         """
+        fingerprint = self._get_gui_fingerprint()
+        if not force and fingerprint == self._last_gui_fingerprint:
+            return
+        self._last_gui_fingerprint = fingerprint
+
         new_config = self._get_config_from_sections()
 
         if not force and new_config == self.config:
@@ -352,7 +417,8 @@ Configure your settings below, then click "Start Application" to begin:"""
             enable_logging=feature_values["enable_logging"],
             enable_audio_feedback=feature_values["enable_audio_feedback"],
             debug_mode=feature_values["debug_mode"],
-            custom_glossary=self.glossary_section.get_terms(),
+            # Validation already copies the list, so skip get_terms()' own copy
+            custom_glossary=self.glossary_section.glossary_terms,
             custom_refinement_prompt=self.prompt_section.get_prompt(),
         )
 
@@ -386,7 +452,36 @@ Configure your settings below, then click "Start Application" to begin:"""
 
     def _test_configuration(self):
         """Test all provider API keys and show comprehensive status."""
-        status_report = self.api_section.test_api_keys()
+        if self._test_in_progress:
+            return
+        self._test_in_progress = True
+        if self.test_btn:
+            self.test_btn.configure(text="Testing...", state="disabled")
+
+        # Read the widgets here; the network checks run off the Tk thread
+        values = self.api_section.get_values()
+        threading.Thread(
+            target=self._run_configuration_test, args=(values,), daemon=True
+        ).start()
+
+    def _run_configuration_test(self, values: dict[str, str]):
+        """Run the API key checks in a worker thread and report back on the Tk thread."""
+        try:
+            status_report = self.api_section.test_api_keys(values)
+        except Exception as error:
+            logger.error(f"Configuration test failed: {error}")
+            status_report = f"Configuration test failed:\n\n{error}"
+        try:
+            self.root.after(0, lambda: self._show_test_results(status_report))
+        except (RuntimeError, tk.TclError):
+            # The window was closed while the checks were running
+            logger.debug("Configuration window closed before test results arrived")
+
+    def _show_test_results(self, status_report: str):
+        """Show the configuration test report."""
+        self._test_in_progress = False
+        if self.test_btn:
+            self.test_btn.configure(text="Test Configuration", state="normal")
         messagebox.showinfo("Configuration Test Results", status_report)
 
     def _reset_to_defaults(self):
@@ -450,13 +545,12 @@ Configure your settings below, then click "Start Application" to begin:"""
         try:
             if self.app_instance:
                 # Start without signal handlers since we're in a thread
-                self.app_instance.start(setup_signals=False)
+                app = self.app_instance
+                app.start(setup_signals=False)
 
-                # Keep running until stopped
-                while self.app_instance and self.app_instance.is_running:
-                    import time
-
-                    time.sleep(0.1)
+                # Park until the app stops, whichever path stops it
+                if app.is_running:
+                    app.wait_until_stopped()
 
         except Exception as error:
             logger.error(f"Application thread error: {error}")
@@ -502,6 +596,9 @@ Configure your settings below, then click "Start Application" to begin:"""
 
     def _close_application(self):
         """Close the configuration GUI."""
+        # Pick up a free-text edit that hasn't been committed by focus-out yet
+        self._apply_config_changes()
+
         if self.is_running:
             if messagebox.askyesno(
                 "Application Running",
@@ -1,44 +1,73 @@
 """Glossary management section for PushToTalk configuration GUI."""
 
+import bisect
+import difflib
+from collections import Counter
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Callable
+from src.config.constants import (
+    GLOSSARY_LISTBOX_DIFF_MAX_ROWS,
+    GLOSSARY_SEARCH_DEBOUNCE_DELAY_MS,
+)
 
 
 class GlossaryTermDialog:
-    """Simple dialog for adding/editing glossary terms."""
+    """Simple dialog for adding/editing glossary terms.
 
-    def __init__(self, parent, title, initial_value=""):
+    The window is built on first use and then withdrawn between uses, so
+    later add/edit prompts only reset the entry and show it again.
+    """
+
+    WIDTH = 350
+    HEIGHT = 150
+    GRAB_RETRY_MS = 50
+
+    def __init__(self, parent):
         self.parent = parent
-        self.title = title
-        self.initial_value = initial_value
         self.result = None
         self.dialog = None
+        self.entry = None
+        self._closed_var = None
 
-    def show(self):
+    def show(self, title, initial_value=""):
         """Show the dialog and return the entered term."""
-        self.dialog = tk.Toplevel(self.parent)
-        self.dialog.title(self.title)
-        self.dialog.geometry("350x150")
-        self.dialog.resizable(False, False)
+        if self.dialog is None or not self.dialog.winfo_exists():
+            self._create_dialog()
 
-        # Make it modal
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        self.result = None
+        self.dialog.title(title)
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, initial_value)
 
         # Center on parent
-        self.dialog.update_idletasks()
-        x = (
-            self.parent.winfo_x()
-            + (self.parent.winfo_width() // 2)
-            - (self.dialog.winfo_width() // 2)
-        )
+        x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (self.WIDTH // 2)
         y = (
             self.parent.winfo_y()
             + (self.parent.winfo_height() // 2)
-            - (self.dialog.winfo_height() // 2)
+            - (self.HEIGHT // 2)
         )
-        self.dialog.geometry(f"+{x}+{y}")
+        self.dialog.geometry(f"{self.WIDTH}x{self.HEIGHT}+{x}+{y}")
+
+        self.dialog.deiconify()
+        self.dialog.update_idletasks()
+        self._closed_var.set(False)
+        self._grab()
+        self.entry.focus()
+        self.entry.select_range(0, tk.END)
+
+        # Wait for OK or Cancel to hide the dialog again
+        self.dialog.wait_variable(self._closed_var)
+
+        return self.result
+
+    def _create_dialog(self):
+        """Build the dialog window and widgets, initially hidden."""
+        self.dialog = tk.Toplevel(self.parent)
+        self.dialog.withdraw()
+        self.dialog.resizable(False, False)
+        self.dialog.transient(self.parent)
+        self._closed_var = tk.BooleanVar(self.dialog, value=False)
 
         # Create widgets
         main_frame = ttk.Frame(self.dialog, padding=20)
@@ -47,11 +76,9 @@ class GlossaryTermDialog:
         # Label and entry
         ttk.Label(main_frame, text="Enter glossary term:").pack(anchor="w", pady=(0, 5))
 
-        self.entry_var = tk.StringVar(value=self.initial_value)
-        entry = ttk.Entry(main_frame, textvariable=self.entry_var, width=40)
-        entry.pack(fill="x", pady=(0, 15))
-        entry.focus()
-        entry.select_range(0, tk.END)
+        # The value is only read on OK, so no Tcl variable is bound to the entry
+        self.entry = ttk.Entry(main_frame, width=40)
+        self.entry.pack(fill="x", pady=(0, 15))
 
         # Buttons
         button_frame = ttk.Frame(main_frame)
@@ -64,24 +91,36 @@ class GlossaryTermDialog:
             side="right"
         )
 
-        # Bind Enter and Escape
+        # Bind Enter and Escape; closing the window counts as Cancel
         self.dialog.bind("<Return>", lambda e: self._ok_clicked())
         self.dialog.bind("<Escape>", lambda e: self._cancel_clicked())
+        self.dialog.protocol("WM_DELETE_WINDOW", self._cancel_clicked)
 
-        # Wait for dialog to close
-        self.dialog.wait_window()
-
-        return self.result
+    def _grab(self):
+        """Make the dialog modal, retrying until the window is viewable."""
+        if self._closed_var.get():
+            return
+        try:
+            self.dialog.grab_set()
+        except tk.TclError:
+            # The window manager has not mapped the dialog yet
+            self.dialog.after(self.GRAB_RETRY_MS, self._grab)
+
+    def _close(self):
+        """Hide the dialog for reuse and release the caller's wait."""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._closed_var.set(True)
 
     def _ok_clicked(self):
         """Handle OK button click."""
-        self.result = self.entry_var.get()
-        self.dialog.destroy()
+        self.result = self.entry.get()
+        self._close()
 
     def _cancel_clicked(self):
         """Handle Cancel button click."""
         self.result = None
-        self.dialog.destroy()
+        self._close()
 
 
 class GlossarySection:
@@ -105,7 +144,18 @@ class GlossarySection:
         """
         self.root = root
         self.on_change = on_change
-        self.glossary_terms = list(initial_terms)
+        # Saved configs may repeat a term; keep the first so each term has one row
+        self.glossary_terms = list(dict.fromkeys(initial_terms))
+        # Bumped on every change so callers can detect edits without copying the list
+        self.terms_version = 0
+        self._terms_lower: list[str] = []  # Lowercased glossary_terms for searching
+        self._term_positions: dict[str, int] = {}  # Term -> index in glossary_terms
+        self._reindex_terms()
+        # Lowercased term counts for case-insensitive duplicate checks; a count,
+        # not a set, since loaded configs may already hold case variants
+        self._lower_counts = Counter(term.lower() for term in self.glossary_terms)
+        # Display order, kept sorted incrementally instead of re-sorted per refresh
+        self._sorted_terms = sorted(self.glossary_terms, key=str.lower)
 
         # Create the frame
         self.frame = ttk.LabelFrame(parent, text="Custom Glossary", padding=10)
@@ -114,6 +164,11 @@ class GlossarySection:
         # Widgets
         self.glossary_search_var = None
         self.glossary_listbox = None
+        self._visible_terms: list[str] = []  # Rows currently in the listbox
+        self._filter_job: str | None = None
+        self._shown_search: str | None = None  # Search the listbox reflects, if any
+        # Shared by Add and Edit; its window is only created when first needed
+        self._term_dialog = GlossaryTermDialog(root)
 
         self._create_widgets()
 
@@ -133,7 +188,7 @@ class GlossarySection:
 
         ttk.Label(search_frame, text="Search:").pack(side="left", padx=(0, 5))
         self.glossary_search_var = tk.StringVar()
-        self.glossary_search_var.trace("w", self._filter_glossary_list)
+        self.glossary_search_var.trace_add("write", self._on_search_changed)
         search_entry = ttk.Entry(
             search_frame, textvariable=self.glossary_search_var, width=50
         )
@@ -183,33 +238,111 @@ class GlossarySection:
         # Initialize the glossary list
         self._refresh_list()
 
-    def _filter_glossary_list(self, *args):
+    def _on_search_changed(self, *args):
+        """Schedule a filter pass, coalescing rapid keystrokes in the search box."""
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(
+            GLOSSARY_SEARCH_DEBOUNCE_DELAY_MS, self._filter_glossary_list
+        )
+
+    def _filter_glossary_list(self):
         """Filter the glossary list based on search term."""
+        self._filter_job = None
         search_term = self.glossary_search_var.get().lower()
-        self.glossary_listbox.delete(0, tk.END)
-
-        for term in self.glossary_terms:
-            if search_term in term.lower():
-                self.glossary_listbox.insert(tk.END, term)
+        if search_term == self._shown_search:
+            # e.g. a character typed and erased within one debounce window
+            return
+        self._shown_search = search_term
+        self._show_terms(
+            [
+                term
+                for term, term_lower in zip(self.glossary_terms, self._terms_lower)
+                if search_term in term_lower
+            ]
+        )
 
     def _refresh_list(self):
-        """Refresh the glossary list display."""
+        """Refresh the glossary list display after the terms have changed."""
+        # Every mutation of glossary_terms ends here, so keep the search index in sync
+        self._terms_lower = [term.lower() for term in self.glossary_terms]
+        self.terms_version += 1
+        self._shown_search = None
+
         if not self.glossary_listbox:
             return
 
-        self.glossary_listbox.delete(0, tk.END)
-        for term in sorted(self.glossary_terms, key=str.lower):
-            self.glossary_listbox.insert(tk.END, term)
+        # Pass a copy: _show_terms keeps it as the record of what is displayed
+        self._show_terms(list(self._sorted_terms))
+
+    def _reindex_terms(self, start: int = 0):
+        """
+        Rebuild term positions for glossary_terms from the given index onward.
+
+        Args:
+            start: First index whose position may have changed
+        """
+        if start == 0:
+            self._term_positions = {}
+        for index in range(start, len(self.glossary_terms)):
+            self._term_positions[self.glossary_terms[index]] = index
+
+    def _remove_sorted_term(self, term: str):
+        """
+        Remove a term from the sorted display list.
+
+        Args:
+            term: Term to remove; must be present
+        """
+        index = bisect.bisect_left(self._sorted_terms, term.lower(), key=str.lower)
+        # Terms differing only in case share a sort key, so find the exact one
+        while self._sorted_terms[index] != term:
+            index += 1
+        del self._sorted_terms[index]
+
+    def _show_terms(self, terms: list[str]):
+        """
+        Update the listbox to show the given terms, touching only changed rows.
+
+        Args:
+            terms: Terms to display, in display order
+        """
+        if terms == self._visible_terms:
+            return
+        if (
+            len(self._visible_terms) > GLOSSARY_LISTBOX_DIFF_MAX_ROWS
+            or len(terms) > GLOSSARY_LISTBOX_DIFF_MAX_ROWS
+        ):
+            # Too large to diff cheaply; repopulate the whole list instead
+            self.glossary_listbox.delete(0, tk.END)
+            if terms:
+                self.glossary_listbox.insert(tk.END, *terms)
+            self._visible_terms = terms
+            return
+        matcher = difflib.SequenceMatcher(
+            None, self._visible_terms, terms, autojunk=False
+        )
+        # Apply from the end so earlier row indices stay valid
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            if i2 > i1:
+                self.glossary_listbox.delete(i1, i2 - 1)
+            if j2 > j1:
+                self.glossary_listbox.insert(i1, *terms[j1:j2])
+        self._visible_terms = terms
 
     def _add_term(self):
         """Add a new glossary term."""
-        dialog = GlossaryTermDialog(self.root, "Add Glossary Term")
-        term = dialog.show()
+        term = self._term_dialog.show("Add Glossary Term")
 
         if term and term.strip():
             term = term.strip()
-            if term not in self.glossary_terms:
+            if not self._lower_counts[term.lower()]:
+                self._term_positions[term] = len(self.glossary_terms)
+                self._lower_counts[term.lower()] += 1
                 self.glossary_terms.append(term)
+                bisect.insort(self._sorted_terms, term, key=str.lower)
                 self._refresh_list()
                 if self.on_change:
                     self.on_change()
@@ -228,16 +361,23 @@ class GlossarySection:
         index = selection[0]
         current_term = self.glossary_listbox.get(index)
 
-        dialog = GlossaryTermDialog(self.root, "Edit Glossary Term", current_term)
-        new_term = dialog.show()
+        new_term = self._term_dialog.show("Edit Glossary Term", current_term)
 
         if new_term and new_term.strip():
             new_term = new_term.strip()
             if new_term != current_term:
-                if new_term not in self.glossary_terms:
-                    # Find the actual index in the sorted list
-                    actual_index = self.glossary_terms.index(current_term)
+                new_lower = new_term.lower()
+                current_lower = current_term.lower()
+                # A case-only edit of the term itself is not a duplicate
+                if self._lower_counts[new_lower] <= (new_lower == current_lower):
+                    # Listbox rows are in display order, not glossary_terms order
+                    actual_index = self._term_positions.pop(current_term)
+                    self._term_positions[new_term] = actual_index
+                    self._lower_counts[current_lower] -= 1
+                    self._lower_counts[new_lower] += 1
                     self.glossary_terms[actual_index] = new_term
+                    self._remove_sorted_term(current_term)
+                    bisect.insort(self._sorted_terms, new_term, key=str.lower)
                     self._refresh_list()
                     if self.on_change:
                         self.on_change()
@@ -260,7 +400,11 @@ class GlossarySection:
         if messagebox.askyesno(
             "Confirm Delete", f"Are you sure you want to delete '{term}'?"
         ):
-            self.glossary_terms.remove(term)
+            actual_index = self._term_positions.pop(term)
+            self._lower_counts[term.lower()] -= 1
+            del self.glossary_terms[actual_index]
+            self._reindex_terms(actual_index)
+            self._remove_sorted_term(term)
             self._refresh_list()
             if self.on_change:
                 self.on_change()
@@ -276,10 +420,13 @@ class GlossarySection:
 
     def set_terms(self, terms: list[str]):
         """
-        Set the glossary terms.
+        Set the glossary terms, dropping exact repeats.
 
         Args:
             terms: New list of glossary terms
         """
-        self.glossary_terms = list(terms)
+        self.glossary_terms = list(dict.fromkeys(terms))
+        self._reindex_terms()
+        self._lower_counts = Counter(term.lower() for term in self.glossary_terms)
+        self._sorted_terms = sorted(self.glossary_terms, key=str.lower)
         self._refresh_list()
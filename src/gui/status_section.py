@@ -22,6 +22,11 @@ class StatusSection:
         self.status_indicator = None
         self.status_label = None
         self.settings_frame = None
+        self.settings_label = None
+
+        # Running state currently drawn by the indicator (None until first draw)
+        self._rendered_running: bool | None = None
+        self._settings_visible = False
 
         self._create_widgets()
 
@@ -46,6 +51,19 @@ class StatusSection:
         # Active settings display (shown when running)
         self.settings_frame = ttk.Frame(self.frame)
 
+        ttk.Label(
+            self.settings_frame,
+            text="Active Settings:",
+            font=("TkDefaultFont", 9, "bold"),
+        ).pack(anchor="w")
+
+        self.settings_label = ttk.Label(
+            self.settings_frame,
+            font=("TkDefaultFont", 8),
+            foreground="darkgreen",
+        )
+        self.settings_label.pack(anchor="w")
+
         # Update initial status
         self.update_display(is_running=False, config=None)
 
@@ -60,6 +78,23 @@ class StatusSection:
         if not self.status_indicator or not self.status_label:
             return
 
+        if is_running != self._rendered_running:
+            self._render_indicator(is_running)
+
+        if is_running:
+            # Show active settings
+            self._show_active_settings(config)
+        else:
+            # Hide active settings
+            self._hide_active_settings()
+
+    def _render_indicator(self, is_running: bool):
+        """
+        Redraw the status indicator and label for a running-state change.
+
+        Args:
+            is_running: Whether the application is currently running
+        """
         self.status_indicator.delete("all")
 
         if is_running:
@@ -70,9 +105,6 @@ class StatusSection:
             self.status_label.config(
                 text="Running - Use your configured hotkeys", foreground="green"
             )
-
-            # Show active settings
-            self._show_active_settings(config)
         else:
             # Gray circle for stopped
             self.status_indicator.create_oval(
@@ -80,8 +112,7 @@ class StatusSection:
             )
             self.status_label.config(text="Ready to start", foreground="black")
 
-            # Hide active settings
-            self._hide_active_settings()
+        self._rendered_running = is_running
 
     def _show_active_settings(self, config: PushToTalkConfig | None):
         """
@@ -93,31 +124,18 @@ class StatusSection:
         if not self.settings_frame or not config:
             return
 
-        # Clear existing content
-        for widget in self.settings_frame.winfo_children():
-            widget.destroy()
-
-        self.settings_frame.pack(fill="x", pady=(10, 0))
-
-        ttk.Label(
-            self.settings_frame,
-            text="Active Settings:",
-            font=("TkDefaultFont", 9, "bold"),
-        ).pack(anchor="w")
-
         settings_text = f"""• Push-to-Talk: {config.hotkey}
 • Toggle Recording: {config.toggle_hotkey}
 • Text Refinement: {"Enabled" if config.enable_text_refinement else "Disabled"}
 • Audio Feedback: {"Enabled" if config.enable_audio_feedback else "Disabled"}"""
 
-        ttk.Label(
-            self.settings_frame,
-            text=settings_text,
-            font=("TkDefaultFont", 8),
-            foreground="darkgreen",
-        ).pack(anchor="w")
+        self.settings_label.config(text=settings_text)
+        if not self._settings_visible:
+            self.settings_frame.pack(fill="x", pady=(10, 0))
+            self._settings_visible = True
 
     def _hide_active_settings(self):
         """Hide the active settings display."""
-        if self.settings_frame:
+        if self.settings_frame and self._settings_visible:
             self.settings_frame.pack_forget()
+            self._settings_visible = False
@@ -1,7 +1,13 @@
 """Validation logic for PushToTalk configuration."""
 
+import http.client
+import socket
 import urllib.request
 import urllib.error
+from src.config.constants import (
+    API_KEY_CHECK_CONNECT_TIMEOUT_SECONDS,
+    API_KEY_CHECK_READ_TIMEOUT_SECONDS,
+)
 from src.push_to_talk import PushToTalkConfig
 
 
@@ -91,8 +97,20 @@ def validate_deepgram_api_key(api_key: str) -> bool:
 
     req = urllib.request.Request(url, headers=headers)
 
+    proxies = urllib.request.getproxies()
+    if "https" not in proxies and "all" not in proxies:
+        # urlopen has one timeout for connect and read; probe the host with a
+        # short connect timeout first so an unreachable network fails fast
+        try:
+            socket.create_connection(
+                ("api.deepgram.com", 443),
+                timeout=API_KEY_CHECK_CONNECT_TIMEOUT_SECONDS,
+            ).close()
+        except OSError as e:
+            raise Exception(f"timeout - Network error: {e}")
+
     try:
-        with urllib.request.urlopen(req, timeout=10):
+        with urllib.request.urlopen(req, timeout=API_KEY_CHECK_READ_TIMEOUT_SECONDS):
             # If we get here, the API key is valid
             return True
     except urllib.error.HTTPError as e:
@@ -104,6 +122,10 @@ def validate_deepgram_api_key(api_key: str) -> bool:
             raise Exception(f"HTTP {e.code}: {e.reason}")
     except urllib.error.URLError as e:
         raise Exception(f"timeout - Network error: {e.reason}")
+    except http.client.HTTPException as e:
+        raise Exception(f"ERROR - Protocol error: {e!r}")
+    except TimeoutError:
+        raise Exception("timeout - Network error: request timed out")
 
 
 def validate_cerebras_api_key(api_key: str) -> bool:
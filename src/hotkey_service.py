@@ -420,7 +420,9 @@ class HotkeyService:
             return self._normalize_key_name(str(name))
 
         except Exception as exc:
-            logger.debug(f"Unable to normalize key '{key}': {exc}")
+            # Reached only when a key fails to normalize; the arguments are
+            # formatted only if a DEBUG sink is active
+            logger.debug("Unable to normalize key '{}': {}", key, exc)
             return None
 
     def _are_keys_active(self, required_keys: Set[str]) -> bool:
@@ -18,6 +18,7 @@ from src.text_refiner_factory import TextRefinerFactory
 from src.text_inserter import TextInserter
 from src.hotkey_service import HotkeyService
 from src.utils import play_start_feedback, play_stop_feedback
+from src.config.constants import SUPPORTED_CHUNK_SIZES, SUPPORTED_SAMPLE_RATES
 from src.exceptions import (
     ConfigurationError,
     TranscriptionError,
@@ -118,6 +119,32 @@ class PushToTalkConfig(BaseModel):
             )
         return v
 
+    @field_validator("sample_rate")
+    @classmethod
+    def validate_sample_rate(cls, v: int) -> int:
+        """Fall back to the default sample rate if the value is not supported."""
+        if v not in SUPPORTED_SAMPLE_RATES:
+            default = cls.model_fields["sample_rate"].default
+            logger.warning(
+                f"sample_rate must be one of {sorted(SUPPORTED_SAMPLE_RATES)}, "
+                f"got {v}; using {default}"
+            )
+            return default
+        return v
+
+    @field_validator("chunk_size")
+    @classmethod
+    def validate_chunk_size(cls, v: int) -> int:
+        """Fall back to the default chunk size if the value is not supported."""
+        if v not in SUPPORTED_CHUNK_SIZES:
+            default = cls.model_fields["chunk_size"].default
+            logger.warning(
+                f"chunk_size must be one of {sorted(SUPPORTED_CHUNK_SIZES)}, "
+                f"got {v}; using {default}"
+            )
+            return default
+        return v
+
     @model_validator(mode="after")
     def validate_hotkeys_different(self) -> "PushToTalkConfig":
         """Validate that push-to-talk and toggle hotkeys are different."""
@@ -134,13 +161,24 @@ class PushToTalkConfig(BaseModel):
     def load_from_file(cls, filepath: str) -> "PushToTalkConfig":
         """Load configuration from JSON file."""
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-            return cls(**data)
+            with open(filepath, "rb") as f:
+                return cls.load_from_handle(f)
         except Exception as e:
             logger.warning(f"Failed to load config from {filepath}: {e}")
             return cls()
 
+    @classmethod
+    def load_from_handle(cls, fp) -> "PushToTalkConfig":
+        """
+        Load configuration from an open binary file.
+
+        The whole document is read with a single ``read()``. The file object
+        sizes that read from the open descriptor itself, so a config replaced
+        on disk after an earlier ``os.stat`` is never read short or stale.
+        """
+        data = json.loads(fp.read())
+        return cls(**data)
+
     def requires_component_reinitialization(self, other: "PushToTalkConfig") -> bool:
         """
         Check if component reinitialization is required when comparing with another config.
@@ -248,6 +286,9 @@ class PushToTalkApp:
 
         # State management
         self.is_running = False
+        # Set whenever the app stops, so other threads can wait on it
+        self._stopped_event = threading.Event()
+        self._stopped_event.set()
 
         # Command queue for handling hotkey events
         self.command_queue = queue.Queue()
@@ -467,6 +508,7 @@ class PushToTalkApp:
         logger.info("Starting PushToTalk application...")
 
         self.is_running = True
+        self._stopped_event.clear()
 
         # Start command processing worker thread
         self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
@@ -493,11 +535,14 @@ class PushToTalkApp:
         """Stop the PushToTalk application."""
         if not self.is_running:
             logger.warning("Application is not running")
+            self._stopped_event.set()
             return
 
         logger.info("Stopping PushToTalk application...")
 
         self.is_running = False
+        # Wake waiters now; the rest of the shutdown doesn't need them parked
+        self._stopped_event.set()
         self.hotkey_service.stop_service()
 
         # Signal worker thread to stop
@@ -532,6 +577,18 @@ class PushToTalkApp:
 
         logger.info("PushToTalk application stopped")
 
+    def wait_until_stopped(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the application stops.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            True if the application is stopped, False if the timeout expired
+        """
+        return self._stopped_event.wait(timeout)
+
     def run(self):
         """Run the application until stopped."""
         self.start()
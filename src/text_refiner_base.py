@@ -6,6 +6,12 @@ from src.config.prompts import (
     text_refiner_prompt_w_glossary,
 )
 
+# The glossary template has a single placeholder, so it is split once here
+# and glossary prompts are built by concatenation instead of str.format()
+_GLOSSARY_PROMPT_PREFIX, _GLOSSARY_PROMPT_SUFFIX = text_refiner_prompt_w_glossary.split(
+    "{custom_glossary}"
+)
+
 
 class TextRefinerBase(ABC):
     """Base class for text refinement providers."""
@@ -82,12 +88,10 @@ class TextRefinerBase(ABC):
             Formatted developer prompt string
         """
         if self.glossary:
-            # Format glossary terms into a bullet list
-            formatted_glossary = "\n".join(
-                f"- {term}" for term in sorted(self.glossary, key=str.lower)
-            )
-            return text_refiner_prompt_w_glossary.format(
-                custom_glossary=formatted_glossary
+            return (
+                _GLOSSARY_PROMPT_PREFIX
+                + self._format_glossary()
+                + _GLOSSARY_PROMPT_SUFFIX
             )
         else:
             return text_refiner_prompt_wo_glossary
@@ -102,10 +106,17 @@ class TextRefinerBase(ABC):
         prompt = self.custom_refinement_prompt
         if "{custom_glossary}" in prompt:
             if self.glossary:
-                formatted_glossary = "\n".join(
-                    f"- {term}" for term in sorted(self.glossary, key=str.lower)
-                )
+                formatted_glossary = self._format_glossary()
             else:
                 formatted_glossary = "(No glossary terms configured)"
             prompt = prompt.replace("{custom_glossary}", formatted_glossary)
         return prompt
+
+    def _format_glossary(self) -> str:
+        """
+        Format glossary terms into a case-insensitively sorted bullet list.
+
+        Returns:
+            Glossary terms as "- term" lines
+        """
+        return "\n".join(f"- {term}" for term in sorted(self.glossary, key=str.lower))
@@ -1,8 +1,30 @@
+import sys
 from typing import Optional
 from src.text_refiner_base import TextRefinerBase
-from src.text_refiner_openai import TextRefinerOpenAI
-from src.text_refiner_cerebras import CerebrasTextRefiner
-from src.text_refiner_gemini import GeminiTextRefiner
+
+
+def __getattr__(name: str):
+    """
+    Import provider refiners on first access (PEP 562).
+
+    Each provider pulls in its own SDK, so only the selected one is loaded.
+    """
+    if name == "TextRefinerOpenAI":
+        from src.text_refiner_openai import TextRefinerOpenAI as provider_class
+    elif name == "CerebrasTextRefiner":
+        from src.text_refiner_cerebras import CerebrasTextRefiner as provider_class
+    elif name == "GeminiTextRefiner":
+        from src.text_refiner_gemini import GeminiTextRefiner as provider_class
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = provider_class
+    return provider_class
+
+
+def _provider_class(name: str) -> type[TextRefinerBase]:
+    """Resolve a provider class through the module so patched attributes win."""
+    return getattr(sys.modules[__name__], name)
 
 
 class TextRefinerFactory:
@@ -32,14 +54,16 @@ class TextRefinerFactory:
         Raises:
             ValueError: If the provider is not supported
         """
-        if provider == "openai":
-            refiner = TextRefinerOpenAI(api_key=api_key, model=model, base_url=base_url)
+        if provider in ("openai", "custom"):
+            refiner = _provider_class("TextRefinerOpenAI")(
+                api_key=api_key, model=model, base_url=base_url
+            )
         elif provider == "cerebras":
-            refiner = CerebrasTextRefiner(api_key=api_key, model=model)
+            refiner = _provider_class("CerebrasTextRefiner")(
+                api_key=api_key, model=model
+            )
         elif provider == "gemini":
-            refiner = GeminiTextRefiner(api_key=api_key, model=model)
-        elif provider == "custom":
-            refiner = TextRefinerOpenAI(api_key=api_key, model=model, base_url=base_url)
+            refiner = _provider_class("GeminiTextRefiner")(api_key=api_key, model=model)
         else:
             raise ValueError(
                 f"Unsupported refinement provider: {provider}. "
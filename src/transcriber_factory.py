@@ -1,7 +1,28 @@
+import sys
 from typing import List, Optional
 from src.transcription_base import TranscriberBase
-from src.transcription_openai import OpenAITranscriber
-from src.transcription_deepgram import DeepgramTranscriber
+
+
+def __getattr__(name: str):
+    """
+    Import provider transcribers on first access (PEP 562).
+
+    Each provider pulls in its own SDK, so only the selected one is loaded.
+    """
+    if name == "OpenAITranscriber":
+        from src.transcription_openai import OpenAITranscriber as provider_class
+    elif name == "DeepgramTranscriber":
+        from src.transcription_deepgram import DeepgramTranscriber as provider_class
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = provider_class
+    return provider_class
+
+
+def _provider_class(name: str) -> type[TranscriberBase]:
+    """Resolve a provider class through the module so patched attributes win."""
+    return getattr(sys.modules[__name__], name)
 
 
 class TranscriberFactory:
@@ -30,9 +51,13 @@ class TranscriberFactory:
             ValueError: If an unknown provider is specified
         """
         if provider == "openai":
-            transcriber = OpenAITranscriber(api_key=api_key, model=model)
+            transcriber = _provider_class("OpenAITranscriber")(
+                api_key=api_key, model=model
+            )
         elif provider == "deepgram":
-            transcriber = DeepgramTranscriber(api_key=api_key, model=model)
+            transcriber = _provider_class("DeepgramTranscriber")(
+                api_key=api_key, model=model
+            )
         else:
             raise ValueError(f"Unknown transcription provider: {provider}")
 
@@ -6,6 +6,11 @@ from playsound3 import playsound
 
 from src.config.constants import AUDIO_DURATION_MIN_THRESHOLD_SECONDS
 
+try:
+    import winsound
+except ImportError:  # Not on Windows
+    winsound = None
+
 
 # Audio file paths
 _ASSETS_DIR = Path(__file__).parent / "assets" / "audio"
@@ -13,12 +18,24 @@ _START_SOUND_PATH = _ASSETS_DIR / "start_feedback.wav"
 _STOP_SOUND_PATH = _ASSETS_DIR / "stop_feedback.wav"
 
 
+def _play_feedback_sound(sound_path: Path):
+    """Play a feedback sound without blocking the caller."""
+    if winsound is not None:
+        # PlaySound with SND_ASYNC returns immediately and needs no helper thread
+        winsound.PlaySound(
+            str(sound_path),
+            winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT,
+        )
+    else:
+        playsound(str(sound_path), block=False)
+
+
 def play_start_feedback():
     """Play a high-pitched beep for recording start."""
 
     try:
         if _START_SOUND_PATH.exists():
-            playsound(str(_START_SOUND_PATH), block=False)
+            _play_feedback_sound(_START_SOUND_PATH)
         else:
             logger.warning(f"Start feedback audio file not found: {_START_SOUND_PATH}")
     except Exception as e:
@@ -30,7 +47,7 @@ def play_stop_feedback():
 
     try:
         if _STOP_SOUND_PATH.exists():
-            playsound(str(_STOP_SOUND_PATH), block=False)
+            _play_feedback_sound(_STOP_SOUND_PATH)
         else:
             logger.warning(f"Stop feedback audio file not found: {_STOP_SOUND_PATH}")
     except Exception as e:
@@ -1,8 +1,10 @@
 import pytest
-import threading
+import pyaudio
 from loguru import logger
 from unittest.mock import MagicMock
 import time
+import os
+import wave
 
 from src.audio_recorder import AudioRecorder
 from src.exceptions import AudioRecordingError
@@ -39,9 +41,9 @@ class TestAudioRecorder:
         assert self.recorder.sample_rate == 16000
         assert self.recorder.chunk_size == 1024
         assert self.recorder.channels == 1
+        assert self.recorder.sample_width == 2
         assert self.recorder.is_recording is False
-        assert self.recorder.audio_data == []
-        assert self.recorder.recording_thread is None
+        assert self.recorder._wave_writer is None
         assert self.recorder.audio_interface == self.mock_audio_interface
         assert self.recorder.stream is None
 
@@ -78,11 +80,30 @@ class TestAudioRecorder:
         assert self.recorder.is_recording is True
         assert self.recorder.audio_interface == self.mock_audio_interface
         assert self.recorder.stream == mock_stream
-        assert isinstance(self.recorder.recording_thread, threading.Thread)
 
         self.mock_audio_interface.open.assert_called_once()
+        _, kwargs = self.mock_audio_interface.open.call_args
+        assert kwargs["stream_callback"] == self.recorder._on_audio_chunk
         logger.info("Start recording success test passed")
 
+    def test_audio_interface_reused_across_recordings(self, mocker):
+        """Test that only the stream is reopened between recordings"""
+        logger.info("Testing audio interface reuse across recordings")
+
+        mock_stream = MagicMock()
+        self.mock_audio_interface.open.return_value = mock_stream
+
+        for _ in range(2):
+            assert self.recorder.start_recording() is True
+            self.recorder.stop_recording()
+
+        assert self.mock_pyaudio.call_count == 1
+        assert self.mock_audio_interface.open.call_count == 2
+        assert mock_stream.close.call_count == 2
+        self.mock_audio_interface.terminate.assert_not_called()
+
+        logger.info("Audio interface reuse test passed")
+
     def test_start_recording_already_recording(self, mocker):
         """Test starting recording when already recording"""
         logger.info("Testing start recording when already recording")
@@ -107,12 +128,16 @@ class TestAudioRecorder:
         # Simulate open failure since PyAudio is already initialized
         self.mock_audio_interface.open.side_effect = Exception("Stream open failed")
 
+        temp_file_remove = mocker.spy(os, "remove")
+
         result = self.recorder.start_recording()
 
         assert result is False
         assert self.recorder.is_recording is False
         assert self.recorder.audio_interface is not None  # Interface stays alive
         assert self.recorder.stream is None
+        assert self.recorder._wave_writer is None
+        temp_file_remove.assert_called_once()  # Temp WAV file is cleaned up
 
         logger.info("Start recording failure test passed")
 
@@ -132,40 +157,78 @@ class TestAudioRecorder:
         # Setup mocks
         mock_stream = MagicMock()
         self.mock_audio_interface.open.return_value = mock_stream
-        self.mock_audio_interface.get_sample_size.return_value = 2  # 16-bit
 
-        # Setup temp file mock
+        # Setup temp file mocks
+        mock_mkstemp = mocker.patch(
+            "tempfile.mkstemp", return_value=(42, "test_audio.wav")
+        )
         temp_file_mock = MagicMock()
-        temp_file_mock.name = "test_audio.wav"
-        temp_file_mock.close = MagicMock()
-        mock_temp_file = mocker.patch("tempfile.NamedTemporaryFile")
-        mock_temp_file.return_value = temp_file_mock
+        mock_fdopen = mocker.patch("os.fdopen", return_value=temp_file_mock)
 
         # Setup wave file mock
         wave_file_mock = MagicMock()
-        mock_wave_open = mocker.patch("wave.open")
-        mock_wave_open.return_value.__enter__ = MagicMock(return_value=wave_file_mock)
-        mock_wave_open.return_value.__exit__ = MagicMock(return_value=False)
+        wave_file_mock.getnframes.return_value = 16000  # 1 second
+        mock_wave_open = mocker.patch("wave.open", return_value=wave_file_mock)
 
-        # Start recording
+        # Start recording and deliver audio through the stream callback
         self.recorder.start_recording()
-
-        # Add some mock audio data
-        self.recorder.audio_data = [b"test_audio_chunk_1", b"test_audio_chunk_2"]
-
-        # Keep recording flag true so stop_recording doesn't exit early
-        # The method itself will set it to False
-        self.recorder.recording_thread = MagicMock()
-        self.recorder.recording_thread.join = MagicMock()
+        self.recorder._on_audio_chunk(b"test_audio_chunk_1", 9, {}, 0)
+        self.recorder._on_audio_chunk(b"test_audio_chunk_2", 9, {}, 0)
 
         result = self.recorder.stop_recording()
 
         assert result == "test_audio.wav"
-        mock_temp_file.assert_called_once()
-        mock_wave_open.assert_called_once_with("test_audio.wav", "wb")
+        mock_mkstemp.assert_called_once_with(suffix=".wav")
+        mock_fdopen.assert_called_once_with(42, "wb", buffering=64 * 1024)
+        mock_wave_open.assert_called_once_with(temp_file_mock, "wb")
+        wave_file_mock.setsampwidth.assert_called_once_with(2)
+        assert wave_file_mock.writeframesraw.call_count == 2
+        wave_file_mock.close.assert_called_once()
+        temp_file_mock.close.assert_called_once()
 
         logger.info("Stop recording success test passed")
 
+    def test_stop_recording_writes_valid_wav(self):
+        """Test that the saved WAV header matches the captured frames"""
+        logger.info("Testing WAV output of stop recording")
+
+        self.mock_audio_interface.open.return_value = MagicMock()
+
+        pcm = bytes(range(256)) * 125  # 1 second of 16-bit mono audio
+        self.recorder.start_recording()
+        for offset in range(0, len(pcm), 512):
+            self.recorder._on_audio_chunk(pcm[offset : offset + 512], 256, {}, 0)
+
+        result = self.recorder.stop_recording()
+
+        try:
+            with wave.open(result, "rb") as wf:
+                assert wf.getnchannels() == 1
+                assert wf.getsampwidth() == 2
+                assert wf.getframerate() == 16000
+                assert wf.getnframes() == len(pcm) // 2
+                assert wf.readframes(wf.getnframes()) == pcm
+        finally:
+            os.remove(result)
+
+        logger.info("WAV output test passed")
+
+    def test_stop_recording_discards_short_audio(self, mocker):
+        """Test that clips below the minimum duration are not kept"""
+        logger.info("Testing stop recording with too-short audio")
+
+        self.mock_audio_interface.open.return_value = MagicMock()
+
+        self.recorder.start_recording()
+        temp_filename = self.recorder._temp_filename
+        self.recorder._on_audio_chunk(b"\x00\x00" * 1024, 1024, {}, 0)  # 64 ms
+
+        result = self.recorder.stop_recording()
+
+        assert result is None
+        assert not os.path.exists(temp_filename)
+        logger.info("Stop recording short audio test passed")
+
     def test_stop_recording_no_data(self, mocker):
         """Test stopping recording with no audio data"""
         logger.info("Testing stop recording with no audio data")
@@ -175,12 +238,13 @@ class TestAudioRecorder:
 
         # Start recording
         self.recorder.start_recording()
+        temp_filename = self.recorder._temp_filename
 
-        # Immediately stop without adding data
-        self.recorder.is_recording = False
+        # Immediately stop without delivering any audio
         result = self.recorder.stop_recording()
 
         assert result is None
+        assert not os.path.exists(temp_filename)
         logger.info("Stop recording no data test passed")
 
     def test_cleanup(self, mocker):
@@ -221,27 +285,69 @@ class TestAudioRecorder:
         self.recorder._cleanup_stream()
 
         mock_stream.stop_stream.assert_called_once()
+        # Closing aborts the stream, so it still counts as stopped
+        mock_stream.close.assert_called_once()
+        assert self.recorder.stream is None
         logger.info("Cleanup with exception test passed")
 
-    def test_record_audio_thread(self, mocker):
-        """Test the recording thread functionality"""
-        logger.info("Testing recording thread functionality")
-
+    def test_stop_recording_keeps_file_when_stream_cannot_stop(self, mocker):
+        """Test that the file is left alone while the stream may still write"""
         mock_stream = MagicMock()
-        mock_stream.read.side_effect = [b"chunk1", b"chunk2", Exception("Stream ended")]
+        mock_stream.stop_stream.side_effect = Exception("Stream stop failed")
+        mock_stream.close.side_effect = Exception("Stream close failed")
         self.mock_audio_interface.open.return_value = mock_stream
+        self.recorder.start_recording()
 
-        # Start recording
+        assert self.recorder.stop_recording() is None
+        assert self.recorder._write_frames is not None
+
+        # Let teardown release the stream and file
+        mock_stream.close.side_effect = None
+
+    def test_audio_callback_aborts_on_write_error(self, mocker):
+        """Test that a failed write ends the stream and drops the recording"""
+        wave_file_mock = MagicMock()
+        wave_file_mock.writeframesraw.side_effect = OSError("No space left on device")
+        mocker.patch("wave.open", return_value=wave_file_mock)
+        self.mock_audio_interface.open.return_value = MagicMock()
         self.recorder.start_recording()
-        self.recorder.is_recording = True
 
-        # Run the recording method directly
-        self.recorder._record_audio()
+        result = self.recorder._on_audio_chunk(b"chunk", 3, {}, 0)
 
-        # Should have stopped recording due to exception
-        assert self.recorder.is_recording is False
+        assert result == (None, pyaudio.paAbort)
+        assert self.recorder.stop_recording() is None
+        assert self.recorder._temp_filename is None
+
+    def test_audio_callback_tolerates_closed_file(self):
+        """Test that a late callback after the file is closed does not raise"""
+        assert self.recorder._write_frames is None
+        assert self.recorder._on_audio_chunk(b"chunk", 3, {}, 0) == (
+            None,
+            pyaudio.paAbort,
+        )
+
+    def test_audio_callback_writes_chunks(self, mocker):
+        """Test that the stream callback writes audio and keeps the stream alive"""
+        logger.info("Testing audio stream callback")
+
+        wave_file_mock = MagicMock()
+        wave_file_mock.getnframes.return_value = 0  # Temp file is discarded
+        mocker.patch("wave.open", return_value=wave_file_mock)
+        self.mock_audio_interface.open.return_value = MagicMock()
+        self.recorder.start_recording()
+
+        results = [
+            self.recorder._on_audio_chunk(chunk, 3, {}, 0)
+            for chunk in (b"chunk1", b"chunk2")
+        ]
 
-        logger.info("Record audio thread test passed")
+        assert [c.args[0] for c in wave_file_mock.writeframesraw.call_args_list] == [
+            b"chunk1",
+            b"chunk2",
+        ]
+        assert all(result == (None, pyaudio.paContinue) for result in results)
+
+        logger.info("Audio stream callback test passed")
 
     def test_destructor_cleanup(self, mocker):
         """Test that destructor calls cleanup"""
@@ -262,38 +368,18 @@ class TestAudioRecorder:
         """Test sample width fallback logic"""
         logger.info("Testing sample width fallback logic")
 
-        mock_stream = MagicMock()
-        self.mock_audio_interface.open.return_value = mock_stream
-
         # Mock get_sample_size to fail
-        self.mock_audio_interface.get_sample_size.side_effect = Exception(
-            "Failed to get sample size"
+        mocker.patch(
+            "pyaudio.get_sample_size",
+            side_effect=Exception("Failed to get sample size"),
         )
 
-        # Start recording
-        self.recorder.start_recording()
-        self.recorder.audio_data = [b"test_data"]
-        # Keep recording flag true so stop_recording doesn't exit early
-
-        temp_file_mock = MagicMock()
-        temp_file_mock.name = "test_audio.wav"
-        temp_file_mock.close = MagicMock()
-        mock_temp_file = mocker.patch("tempfile.NamedTemporaryFile")
-        mock_temp_file.return_value = temp_file_mock
-
-        wave_file_mock = MagicMock()
-        mock_wave_open = mocker.patch("wave.open")
-        mock_wave_open.return_value.__enter__ = MagicMock(return_value=wave_file_mock)
-        mock_wave_open.return_value.__exit__ = MagicMock(return_value=False)
-
-        # Mock the recording thread
-        self.recorder.recording_thread = MagicMock()
-        self.recorder.recording_thread.join = MagicMock()
-
-        self.recorder.stop_recording()
+        recorder = AudioRecorder()
 
         # Should use fallback sample width (2 for paInt16)
-        wave_file_mock.setsampwidth.assert_called_with(2)
+        assert recorder.sample_width == 2
+
+        recorder.shutdown()
 
         logger.info("Sample width fallback test passed")
 
@@ -2,6 +2,8 @@ import sys
 import types
 from unittest.mock import MagicMock
 
+import pytest
+
 from tests.test_helpers import create_keyboard_stub, create_pyautogui_stub
 
 # Setup stubs for GUI-related imports
@@ -58,6 +60,65 @@ def test_force_notify_triggers_update_even_when_values_match(prepared_config_gui
     assert forced_config == config
 
 
+def test_unchanged_gui_values_skip_config_rebuild(prepared_config_gui, mocker):
+    gui = prepared_config_gui
+
+    gui.hotkey_section.hotkey_var.set("ctrl+alt+h")
+    gui._notify_config_changed()
+    assert gui.config.hotkey == "ctrl+alt+h"
+
+    build_spy = mocker.spy(gui, "_get_config_from_sections")
+    gui._notify_config_changed()
+    build_spy.assert_not_called()
+
+    gui.hotkey_section.hotkey_var.set("ctrl+alt+j")
+    gui._notify_config_changed()
+    build_spy.assert_called_once()
+    assert gui.config.hotkey == "ctrl+alt+j"
+
+    # Glossary edits are detected through the section's version counter
+    gui.glossary_section.set_terms(["alpha", "beta"])
+    gui._notify_config_changed()
+    assert build_spy.call_count == 2
+    assert gui.config.custom_glossary == ["alpha", "beta"]
+    assert gui.config.custom_glossary is not gui.glossary_section.glossary_terms
+
+
+def test_rapid_changes_schedule_single_debounced_update(prepared_config_gui):
+    gui = prepared_config_gui
+    gui.root = MagicMock()
+    gui.root.winfo_exists.return_value = True
+    gui.root.after.return_value = "after#1"
+
+    for _ in range(5):
+        gui._on_config_changed()
+
+    gui.root.after.assert_called_once()
+    gui.root.after_cancel.assert_not_called()
+
+    # Once the pending update has run, the next change opens a new window
+    gui._apply_config_changes()
+    gui._on_config_changed()
+    assert gui.root.after.call_count == 2
+
+
+def test_api_key_entries_are_not_traced(prepared_config_gui):
+    gui = prepared_config_gui
+
+    traced = gui._get_traced_variables()
+    all_vars = gui._get_config_variables()
+
+    assert gui.api_section.openai_api_key_var not in traced
+    assert gui.api_section.custom_endpoint_var not in traced
+    assert gui.api_section.openai_api_key_var in all_vars
+    assert gui.hotkey_section.hotkey_var in traced
+
+    # A committed text edit is reported through the section's change callback
+    gui.api_section.on_change = MagicMock()
+    gui.api_section._on_text_committed()
+    gui.api_section.on_change.assert_called_once()
+
+
 def test_config_changes_trigger_async_save(tmp_path, prepared_config_gui, mocker):
     """Test that configuration changes trigger asynchronous save to JSON file."""
     import time
@@ -154,6 +215,132 @@ def test_concurrent_async_saves_are_deduplicated(tmp_path, prepared_config_gui):
     assert saved_data["openai_api_key"] == "test-key"
 
 
+def test_persistence_patches_only_changed_fields():
+    """Test that the auto-save payload is patched in place between saves."""
+    from src.gui.config_persistence import ConfigurationPersistence
+
+    persistence = ConfigurationPersistence()
+    config = PushToTalkConfig(custom_glossary=["alpha"])
+
+    first = persistence._serialize_config(config)
+    assert first == config.model_dump()
+
+    config.hotkey = "ctrl+alt+h"
+    config.custom_glossary.append("beta")
+    second = persistence._serialize_config(config)
+
+    assert second is first
+    assert second == config.model_dump()
+    # The mirrored list must be a copy so later in-place edits are detected
+    assert second["custom_glossary"] is not config.custom_glossary
+
+
+def test_persistence_reuses_single_save_worker(tmp_path):
+    """Test that successive async saves are handled by one long-lived worker."""
+    import json
+    import time
+
+    from src.gui.config_persistence import ConfigurationPersistence
+
+    persistence = ConfigurationPersistence()
+    config_file = tmp_path / "worker_test.json"
+
+    persistence.save_async(PushToTalkConfig(hotkey="ctrl+alt+a"), str(config_file))
+    worker = persistence._save_thread
+    persistence.save_async(PushToTalkConfig(hotkey="ctrl+alt+b"), str(config_file))
+
+    assert persistence._save_thread is worker
+    assert worker.is_alive()
+
+    # Wait for the latest config to reach disk
+    deadline = time.monotonic() + 2.0
+    saved_data = {}
+    while time.monotonic() < deadline:
+        if config_file.exists():
+            try:
+                saved_data = json.loads(config_file.read_text())
+            except json.JSONDecodeError:
+                saved_data = {}
+            if saved_data.get("hotkey") == "ctrl+alt+b":
+                break
+        time.sleep(0.01)
+
+    assert saved_data["hotkey"] == "ctrl+alt+b"
+
+
+def test_persistence_sync_save_replaces_file_atomically(tmp_path, mocker):
+    """Test that saves go through a temporary file that replaces the target."""
+    import json
+    import os
+
+    from src.gui.config_persistence import ConfigurationPersistence
+
+    config_file = tmp_path / "atomic_test.json"
+    config_file.write_text('{"hotkey": "old"}')
+    replace_spy = mocker.spy(os, "replace")
+
+    ConfigurationPersistence().save_sync(
+        PushToTalkConfig(hotkey="ctrl+alt+n"), str(config_file)
+    )
+
+    replace_spy.assert_called_once()
+    tmp_file, target = replace_spy.call_args.args
+    assert os.path.dirname(tmp_file) == str(tmp_path)
+    assert target == str(config_file)
+    assert json.loads(config_file.read_text())["hotkey"] == "ctrl+alt+n"
+    assert [p.name for p in tmp_path.iterdir()] == ["atomic_test.json"]
+
+
+def test_persistence_failed_write_removes_temp_file(tmp_path, mocker):
+    """Test that a failed save leaves neither a temp file nor a changed target."""
+    from src.gui.config_persistence import ConfigurationPersistence
+
+    config_file = tmp_path / "atomic_test.json"
+    config_file.write_text('{"hotkey": "old"}')
+    mocker.patch("src.gui.config_persistence.os.replace", side_effect=OSError("busy"))
+
+    with pytest.raises(OSError):
+        ConfigurationPersistence().save_sync(
+            PushToTalkConfig(hotkey="ctrl+alt+n"), str(config_file)
+        )
+
+    assert [p.name for p in tmp_path.iterdir()] == ["atomic_test.json"]
+    assert config_file.read_text() == '{"hotkey": "old"}'
+
+
+def test_persistence_skips_write_when_content_unchanged(tmp_path, mocker):
+    """Test that re-saving identical configuration content doesn't touch the file."""
+    import time
+
+    from src.gui import config_persistence
+    from src.gui.config_persistence import ConfigurationPersistence
+
+    persistence = ConfigurationPersistence()
+    config_file = str(tmp_path / "unchanged_test.json")
+    write_spy = mocker.spy(config_persistence, "_write_config_file")
+
+    persistence.save_sync(PushToTalkConfig(hotkey="ctrl+alt+u"), config_file)
+    assert write_spy.call_count == 1
+
+    persistence.save_async(PushToTalkConfig(hotkey="ctrl+alt+u"), config_file)
+
+    # Wait for the worker to pick up and finish the queued save
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline and persistence._queued_save is not None:
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+    assert write_spy.call_count == 1
+
+    # A real change is still written
+    persistence.save_async(PushToTalkConfig(hotkey="ctrl+alt+v"), config_file)
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline and write_spy.call_count < 2:
+        time.sleep(0.01)
+
+    assert write_spy.call_count == 2
+
+
 def test_update_gui_from_config_updates_provider_fields(prepared_config_gui):
     """Test that _update_sections_from_config updates stt_provider and deepgram_api_key."""
     gui = prepared_config_gui
@@ -287,6 +474,24 @@ def test_stt_model_preserved_when_switching_providers(prepared_config_gui):
     assert gui.api_section.deepgram_stt_model == "nova-2"
 
 
+def test_reselecting_same_stt_provider_is_ignored(prepared_config_gui, mocker):
+    gui = prepared_config_gui
+    api = gui.api_section
+    api.on_change = MagicMock()
+    update_spy = mocker.patch.object(api, "_update_stt_model_options")
+
+    # set_values records the provider, so re-selecting it is a no-op
+    api._on_provider_changed()
+    update_spy.assert_not_called()
+    api.on_change.assert_not_called()
+
+    other = "openai" if api.stt_provider_var.get() == "deepgram" else "deepgram"
+    api.stt_provider_var.set(other)
+    api._on_provider_changed()
+    update_spy.assert_called_once()
+    api.on_change.assert_called_once()
+
+
 def test_loaded_config_not_overwritten_during_initialization(
     tmp_path, prepared_config_gui, mocker
 ):
@@ -355,3 +560,252 @@ def test_loaded_config_not_overwritten_during_initialization(
     assert saved_config["sample_rate"] == 16000
     assert saved_config["enable_text_refinement"] is False
     assert saved_config["enable_audio_feedback"] is False
+
+
+def test_api_key_test_report_rechecks_every_key(prepared_config_gui, mocker):
+    api = prepared_config_gui.api_section
+    openai_check = mocker.patch("src.gui.api_section.validate_openai_api_key")
+    deepgram_check = mocker.patch(
+        "src.gui.api_section.validate_deepgram_api_key",
+        side_effect=Exception("401 - Incorrect API key"),
+    )
+
+    values = api.get_values()
+    values["deepgram_api_key"] = "bad-key"
+
+    report = api.test_api_keys(values)
+    assert "[OK] OpenAI" in report
+    assert "[X] Deepgram" in report
+    assert "401 - Incorrect API key" in report
+
+    # Every click probes again, so a since-revoked key is not reported as valid
+    openai_check.side_effect = Exception("INVALID - Incorrect API key")
+    report = api.test_api_keys(values)
+    assert "[X] OpenAI" in report
+    assert openai_check.call_count == 2
+    assert deepgram_check.call_count == 2
+
+
+def test_deepgram_validation_reports_errors(mocker):
+    """Test that Deepgram key check failures map to readable messages."""
+    import http.client
+    import urllib.error
+
+    from src.gui import validators
+
+    mocker.patch("src.gui.validators.urllib.request.getproxies", return_value={})
+    connect = mocker.patch("src.gui.validators.socket.create_connection")
+    urlopen = mocker.patch("src.gui.validators.urllib.request.urlopen")
+    assert validators.validate_deepgram_api_key("key") is True
+    connect.assert_called_once_with(
+        ("api.deepgram.com", 443),
+        timeout=validators.API_KEY_CHECK_CONNECT_TIMEOUT_SECONDS,
+    )
+    assert urlopen.call_args.kwargs["timeout"] == (
+        validators.API_KEY_CHECK_READ_TIMEOUT_SECONDS
+    )
+
+    urlopen.side_effect = urllib.error.HTTPError("url", 401, "", {}, None)
+    with pytest.raises(Exception, match="401 - Incorrect API key"):
+        validators.validate_deepgram_api_key("bad-key")
+
+    urlopen.side_effect = urllib.error.URLError("proxy unreachable")
+    with pytest.raises(Exception, match="timeout - Network error"):
+        validators.validate_deepgram_api_key("key")
+
+    urlopen.side_effect = http.client.BadStatusLine("garbage")
+    with pytest.raises(Exception, match="Protocol error"):
+        validators.validate_deepgram_api_key("key")
+
+
+def test_deepgram_validation_connect_timeout(mocker):
+    """Test that an unreachable host fails on the short connect timeout."""
+    from src.gui import validators
+
+    getproxies = mocker.patch(
+        "src.gui.validators.urllib.request.getproxies", return_value={}
+    )
+    connect = mocker.patch(
+        "src.gui.validators.socket.create_connection",
+        side_effect=TimeoutError("timed out"),
+    )
+    urlopen = mocker.patch("src.gui.validators.urllib.request.urlopen")
+
+    with pytest.raises(Exception, match="timeout - Network error: timed out"):
+        validators.validate_deepgram_api_key("key")
+    urlopen.assert_not_called()
+
+    # Behind an HTTPS proxy the host may not be directly reachable
+    getproxies.return_value = {"https": "http://proxy:8080"}
+    connect.reset_mock()
+    assert validators.validate_deepgram_api_key("key") is True
+    connect.assert_not_called()
+
+
+def test_glossary_term_dialog_is_built_once_and_reused(mocker):
+    """Test that repeated add/edit prompts reuse the same dialog window."""
+    from src.gui import glossary_section
+
+    toplevel_cls = mocker.patch.object(glossary_section.tk, "Toplevel")
+    mocker.patch.object(glossary_section.tk, "BooleanVar")
+    mocker.patch.object(glossary_section, "ttk")
+    parent = MagicMock()
+    parent.winfo_x.return_value = 0
+    parent.winfo_y.return_value = 0
+    parent.winfo_width.return_value = 700
+    parent.winfo_height.return_value = 800
+
+    dialog = glossary_section.GlossaryTermDialog(parent)
+    toplevel = toplevel_cls.return_value
+    toplevel.wait_variable.side_effect = lambda var: dialog._ok_clicked()
+
+    dialog.show("Add Glossary Term")
+    dialog.entry.get.return_value = "kubectl"
+    assert dialog.show("Edit Glossary Term", "kubectl") == "kubectl"
+
+    toplevel_cls.assert_called_once()
+    toplevel.title.assert_called_with("Edit Glossary Term")
+    assert toplevel.withdraw.call_count == 3  # Created hidden, hidden after each use
+
+
+def test_glossary_term_dialog_retries_grab_until_viewable(mocker):
+    """Test that a failed modal grab is retried instead of raising."""
+    from src.gui import glossary_section
+
+    toplevel = mocker.patch.object(glossary_section.tk, "Toplevel").return_value
+    closed_var = mocker.patch.object(glossary_section.tk, "BooleanVar").return_value
+    closed_var.get.return_value = False
+    mocker.patch.object(glossary_section, "ttk")
+    parent = MagicMock()
+    parent.winfo_x.return_value = 0
+    parent.winfo_y.return_value = 0
+    parent.winfo_width.return_value = 700
+    parent.winfo_height.return_value = 800
+
+    dialog = glossary_section.GlossaryTermDialog(parent)
+    toplevel.grab_set.side_effect = [
+        glossary_section.tk.TclError("window not viewable"),
+        None,
+    ]
+    toplevel.wait_variable.side_effect = lambda var: dialog._cancel_clicked()
+
+    assert dialog.show("Add Glossary Term") is None
+
+    toplevel.update_idletasks.assert_called()
+    toplevel.wait_visibility.assert_not_called()
+    toplevel.after.assert_called_once_with(dialog.GRAB_RETRY_MS, dialog._grab)
+
+    # The scheduled retry grabs once the window is mapped
+    dialog._grab()
+    assert toplevel.grab_set.call_count == 2
+
+
+def test_glossary_filter_skips_unchanged_search(prepared_config_gui, mocker):
+    glossary = prepared_config_gui.glossary_section
+    glossary.set_terms(["Kubernetes", "kubectl", "PostgreSQL"])
+
+    show_spy = mocker.spy(glossary, "_show_terms")
+    glossary.glossary_search_var.set("kub")
+    glossary._filter_glossary_list()
+    show_spy.assert_called_once_with(["Kubernetes", "kubectl"])
+
+    # Same search text again (e.g. typed and erased) does not touch the list
+    glossary._filter_glossary_list()
+    show_spy.assert_called_once()
+
+    # A change to the terms makes the next filter pass run again
+    glossary.set_terms(["Kubernetes"])
+    glossary._filter_glossary_list()
+    assert list(glossary.glossary_listbox.get(0, "end")) == ["Kubernetes"]
+
+
+def test_glossary_large_list_is_repopulated(prepared_config_gui, mocker):
+    glossary = prepared_config_gui.glossary_section
+    mocker.patch("src.gui.glossary_section.GLOSSARY_LISTBOX_DIFF_MAX_ROWS", 2)
+    matcher = mocker.patch("src.gui.glossary_section.difflib.SequenceMatcher")
+
+    glossary.set_terms(["alpha", "beta", "gamma"])
+    glossary.glossary_search_var.set("a")
+    glossary._filter_glossary_list()
+
+    matcher.assert_not_called()
+    assert list(glossary.glossary_listbox.get(0, "end")) == [
+        "alpha",
+        "beta",
+        "gamma",
+    ]
+
+
+def test_glossary_duplicates_are_case_insensitive(prepared_config_gui, mocker):
+    glossary = prepared_config_gui.glossary_section
+    glossary.set_terms(["kubectl"])
+    showinfo = mocker.patch("src.gui.glossary_section.messagebox.showinfo")
+    show_dialog = mocker.patch.object(glossary._term_dialog, "show")
+
+    show_dialog.return_value = "KUBECTL"
+    glossary._add_term()
+    assert glossary.get_terms() == ["kubectl"]
+    showinfo.assert_called_once()
+
+    # Changing only the case of the selected term is allowed
+    glossary.glossary_listbox.selection_set(0)
+    show_dialog.return_value = "Kubectl"
+    glossary._edit_term()
+    assert glossary.get_terms() == ["Kubectl"]
+    showinfo.assert_called_once()
+
+
+def test_glossary_repeated_terms_can_be_edited_and_deleted(prepared_config_gui, mocker):
+    glossary = prepared_config_gui.glossary_section
+    glossary.set_terms(["foo", "bar", "foo"])
+    assert glossary.get_terms() == ["foo", "bar"]
+
+    mocker.patch("src.gui.glossary_section.messagebox.askyesno", return_value=True)
+    mocker.patch.object(glossary._term_dialog, "show", return_value="baz")
+
+    # Rows are sorted: "bar", "foo"
+    glossary.glossary_listbox.selection_set(1)
+    glossary._edit_term()
+    assert glossary.get_terms() == ["baz", "bar"]
+
+    glossary.glossary_listbox.selection_clear(0, "end")
+    glossary.glossary_listbox.selection_set(1)
+    glossary._delete_term()
+    glossary.glossary_listbox.selection_set(0)
+    glossary._delete_term()
+    assert glossary.get_terms() == []
+
+
+def test_lazy_custom_endpoint_row_scrolls_with_page(prepared_config_gui):
+    from src.gui.configuration_window import SCROLL_BINDTAG
+
+    api = prepared_config_gui.api_section
+    api.refinement_provider_var.set("custom")
+    api._update_custom_endpoint_visibility()
+
+    assert SCROLL_BINDTAG in api.custom_endpoint_entry.bindtags()
+    assert api.custom_endpoint_frame.bindtags().count(SCROLL_BINDTAG) == 1
+
+
+def test_configuration_test_disables_button_until_results(prepared_config_gui, mocker):
+    gui = prepared_config_gui
+    mocker.patch("src.gui.configuration_window.threading.Thread")
+    showinfo = mocker.patch("src.gui.configuration_window.messagebox.showinfo")
+
+    gui._test_configuration()
+    assert str(gui.test_btn.cget("state")) == "disabled"
+    assert gui.test_btn.cget("text") == "Testing..."
+
+    gui._show_test_results("report")
+    assert str(gui.test_btn.cget("state")) == "normal"
+    showinfo.assert_called_once_with("Configuration Test Results", "report")
+
+
+def test_configuration_test_ignores_closed_window(prepared_config_gui, mocker):
+    gui = prepared_config_gui
+    mocker.patch.object(gui.api_section, "test_api_keys", return_value="report")
+    gui.root = MagicMock()
+    gui.root.after.side_effect = RuntimeError("main thread is not in main loop")
+
+    # Must not raise in the worker thread
+    gui._run_configuration_test({})
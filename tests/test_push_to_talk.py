@@ -1,4 +1,7 @@
 from collections import defaultdict
+import json
+import threading
+import os
 import sys
 import types
 
@@ -259,6 +262,24 @@ def test_load_config_failure_returns_default(tmp_path):
     assert loaded.hotkey  # default values are preserved
 
 
+def test_load_config_reads_whole_file_after_replace(tmp_path):
+    path = tmp_path / "config.json"
+    push_to_talk.PushToTalkConfig(hotkey="ctrl+alt+h").save_to_file(path)
+    stale_size = os.stat(path).st_size
+
+    # An atomic save swaps in a larger file after the size was observed
+    replacement = tmp_path / "config.json.new"
+    push_to_talk.PushToTalkConfig(
+        hotkey="ctrl+alt+h", custom_glossary=["a much longer glossary term"]
+    ).save_to_file(replacement)
+    os.replace(replacement, path)
+    assert os.stat(path).st_size > stale_size
+
+    loaded = push_to_talk.PushToTalkConfig.load_from_file(path)
+
+    assert loaded.custom_glossary == ["a much longer glossary term"]
+
+
 def test_initialization_wires_dependencies(make_app, dependency_stubs):
     config = push_to_talk.PushToTalkConfig(
         stt_provider="openai",
@@ -299,6 +320,21 @@ def test_start_and_stop_application(make_app, dependency_stubs):
     assert hotkey_service.stop_service_calls == 1
 
 
+def test_wait_until_stopped_wakes_on_any_stop(make_app):
+    app = make_app()
+    assert app.wait_until_stopped(timeout=0) is True
+
+    app.start(setup_signals=False)
+    assert app.wait_until_stopped(timeout=0) is False
+
+    waiter = threading.Thread(target=app.wait_until_stopped)
+    waiter.start()
+    app.stop()
+    waiter.join(timeout=1.0)
+
+    assert not waiter.is_alive()
+
+
 def test_process_recorded_audio_pipeline(
     make_app,
     dependency_stubs,
@@ -592,6 +628,33 @@ def test_change_toggle_hotkey_replaces_service(make_app, dependency_stubs):
     assert new_service.callbacks == (app._on_start_recording, app._on_stop_recording)
 
 
+@pytest.mark.parametrize(
+    "field_name, value",
+    [("sample_rate", 22050), ("chunk_size", 1000)],
+)
+def test_config_resets_unsupported_audio_settings(field_name, value):
+    config = push_to_talk.PushToTalkConfig(**{field_name: value})
+
+    default = push_to_talk.PushToTalkConfig.model_fields[field_name].default
+    assert getattr(config, field_name) == default
+
+
+def test_load_config_with_unsupported_sample_rate_keeps_other_fields(tmp_path):
+    path = tmp_path / "config.json"
+    push_to_talk.PushToTalkConfig(
+        openai_api_key="key", custom_glossary=["term1"]
+    ).save_to_file(path)
+    data = json.loads(path.read_text())
+    data["sample_rate"] = 22050
+    path.write_text(json.dumps(data))
+
+    loaded = push_to_talk.PushToTalkConfig.load_from_file(path)
+
+    assert loaded.sample_rate == 16000
+    assert loaded.openai_api_key == "key"
+    assert loaded.custom_glossary == ["term1"]
+
+
 def test_config_requires_component_reinitialization():
     """Test that the requires_component_reinitialization method correctly identifies changes."""
     base_config = push_to_talk.PushToTalkConfig(
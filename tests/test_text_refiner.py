@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 from src.text_refiner_openai import TextRefinerOpenAI
 from src.text_refiner_cerebras import CerebrasTextRefiner
 from src.exceptions import ConfigurationError
+from src.config.prompts import text_refiner_prompt_w_glossary
 
 
 class TestTextRefinerOpenAI:
@@ -371,6 +372,19 @@ class TestTextRefinerOpenAI:
 
         logger.info("Default prompt content test passed")
 
+    def test_default_prompt_with_glossary_matches_template(self):
+        """Test that the glossary prompt equals the formatted template"""
+        logger.info("Testing default prompt with glossary")
+
+        self.refiner.set_glossary(["kubernetes", "API", "OAuth"])
+
+        expected = text_refiner_prompt_w_glossary.format(
+            custom_glossary="- API\n- kubernetes\n- OAuth"
+        )
+        assert self.refiner._get_default_developer_prompt() == expected
+
+        logger.info("Default prompt with glossary test passed")
+
     def test_refine_text_whitespace_handling(self):
         """Test refinement with various whitespace scenarios"""
         logger.info("Testing refinement whitespace handling")
@@ -352,3 +352,25 @@ class TestTextRefinerFactory:
         logger.info(
             "All refiners including Gemini implement base interface test passed"
         )
+
+    def test_provider_classes_resolve_lazily(self, mocker):
+        """Test provider classes are exposed through the factory module on demand"""
+        logger.info("Testing lazy provider class resolution")
+
+        from src import text_refiner_factory
+
+        assert text_refiner_factory.TextRefinerOpenAI is TextRefinerOpenAI
+        assert text_refiner_factory.CerebrasTextRefiner is CerebrasTextRefiner
+        assert text_refiner_factory.GeminiTextRefiner is GeminiTextRefiner
+
+        with pytest.raises(AttributeError):
+            _ = text_refiner_factory.UnknownRefiner
+
+        # A patched module attribute takes precedence over the lazy import
+        mock_refiner_class = mocker.patch("src.text_refiner_factory.GeminiTextRefiner")
+        refiner = TextRefinerFactory.create_refiner(
+            provider="gemini", api_key="test-key", model="gemini-3-flash-preview"
+        )
+        assert refiner is mock_refiner_class.return_value
+
+        logger.info("Lazy provider class resolution test passed")
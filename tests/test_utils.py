@@ -15,6 +15,13 @@ def mock_logger(monkeypatch):
     return logger
 
 
+@pytest.fixture(autouse=True)
+def no_winsound(monkeypatch):
+    """Exercise the cross-platform playsound path unless a test opts in."""
+
+    monkeypatch.setattr(utils, "winsound", None)
+
+
 def test_play_start_feedback_plays_audio(tmp_path, monkeypatch, mock_logger):
     """The start feedback should play when the audio file exists."""
 
@@ -98,6 +105,24 @@ def test_play_stop_feedback_plays_audio(tmp_path, monkeypatch, mock_logger):
     mock_logger.warning.assert_not_called()
 
 
+def test_play_start_feedback_uses_async_winsound(tmp_path, monkeypatch, mock_logger):
+    """On Windows the feedback should go through PlaySound with SND_ASYNC."""
+
+    audio_path = tmp_path / "start.wav"
+    audio_path.write_bytes(b"data")
+
+    winsound = MagicMock(SND_FILENAME=0x1, SND_ASYNC=0x2, SND_NODEFAULT=0x4)
+    playsound = MagicMock()
+    monkeypatch.setattr(utils, "_START_SOUND_PATH", audio_path)
+    monkeypatch.setattr(utils, "winsound", winsound)
+    monkeypatch.setattr(utils, "playsound", playsound)
+
+    utils.play_start_feedback()
+
+    winsound.PlaySound.assert_called_once_with(str(audio_path), 0x7)
+    playsound.assert_not_called()
+
+
 def test_play_stop_feedback_missing_file_warns(monkeypatch, mock_logger):
     """A missing audio file for stop feedback should emit a warning."""
 